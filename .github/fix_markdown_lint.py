@@ -6,25 +6,97 @@ Script to fix common markdown linting issues across the project
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+# All rules in one alternation, so each file is scanned once instead of once
+# per rule. Every branch except MD023 ends on the newline to be doubled; the
+# conditions on the following line are lookaheads so they are never consumed
+# and cannot hide a match on the next line.
+MARKDOWN_LINT_PATTERN = r"""
+    # MD032/MD022/MD031: blank line before a list item, header or fence
+      (?<=[^\n])\n(?=[*+\-]|\#+\s|```)
+    # MD032: blank line after a line holding a list marker
+    | [*+\-][^\n]*\n(?=[^\s*+\-])
+    # MD022: blank line after a header line
+    | \#[^\n]*\n(?=[^\s\#])
+    # MD031: blank line after a fence
+    | ```\n(?=\S)
+    # MD023: headers must start at the beginning of the line
+    | (?P<indent>\n\s+(?=\#+\s))
+"""
+
+# Compiled on first use by markdown_lint_re(), so importing this module (e.g.
+# to reuse fix_markdown_linting) costs nothing until a file is actually fixed
+_markdown_lint_re = None
+
+def markdown_lint_re():
+    """Return the compiled MARKDOWN_LINT_PATTERN, compiling it on first use"""
+    global _markdown_lint_re
+    if _markdown_lint_re is None:
+        _markdown_lint_re = re.compile(MARKDOWN_LINT_PATTERN, re.VERBOSE)
+    return _markdown_lint_re
+
+def _init_worker():
+    """Pool initializer: compile the pattern once in each worker process"""
+    markdown_lint_re()
+
+def _apply_fix(match):
+    """Return the replacement for a single MARKDOWN_LINT_PATTERN match"""
+    if match.lastgroup == 'indent':
+        return '\n\n'
+    return match.group() + '\n'
+
 def fix_markdown_linting(content):
     """Fix common markdown linting issues"""
-    
-    # Fix MD032: Lists should be surrounded by blank lines
-    # Pattern: text followed immediately by a list item
-    content = re.sub(r'([^\n])\n([\*\-\+])', r'\1\n\n\2', content)
-    
-    # Pattern: list item followed immediately by non-list text
-    content = re.sub(r'([\*\-\+].*)\n([^\s\*\-\+\n])', r'\1\n\n\2', content)
-    
-    # Fix MD022: Headers should be surrounded by blank lines
-    content = re.sub(r'([^\n])\n(#+\s)', r'\1\n\n\2', content)
-    content = re.sub(r'(#+.*)\n([^\n\s#])', r'\1\n\n\2', content)
-    
-    # Fix MD023: Headers must start at the beginning of the line
-    content = re.sub(r'\n\s+(#+\s)', r'\n\n\1', content)
-    
-    # Fix MD031: Fenced code blocks should be surrounded by blank lines
-    content = re.sub(r'([^\n])\n```', r'\1\n\n```', content)
-    content = re.sub(r'```\n([^\n\s])', r'
\ No newline at end of file
+    return markdown_lint_re().sub(_apply_fix, content)
+
+def fix_markdown_file(file_path):
+    """Apply the lint fixes to a single markdown file
+
+    Returns a (fixed, message) pair instead of printing, so that output stays
+    in file order when files are processed by a pool of workers.
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        fixed_content = fix_markdown_linting(content)
+
+        # Only write back if changes were made
+        if fixed_content != content:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(fixed_content)
+            return True, f"✅ Fixed {file_path}"
+        return False, None
+    except Exception as e:
+        return False, f"❌ Error processing {file_path}: {e}"
+
+def main():
+    """Fix markdown files given as arguments, or every file under docs/"""
+    # Ensure we're in the repository root
+    if os.path.exists('../.git') and not os.path.exists('.git'):
+        os.chdir('..')
+
+    files = sys.argv[1:] or [str(p) for p in Path('docs').rglob('*.md')]
+
+    print("Fixing markdown linting issues...")
+
+    # The regex work is CPU-bound, so use processes rather than threads. A
+    # compiled pattern would only be pickled as its source and compiled again
+    # in every worker, so each worker compiles it itself, once, at startup;
+    # the parent never needs it.
+    with ProcessPoolExecutor(initializer=_init_worker) as executor:
+        results = list(executor.map(fix_markdown_file, files, chunksize=16))
+
+    fixed_count = 0
+    for fixed, message in results:
+        if message:
+            print(message)
+        if fixed:
+            fixed_count += 1
+
+    print(f"\n🎉 Fixed {fixed_count} of {len(files)} markdown files")
+
+if __name__ == "__main__":
+    main()
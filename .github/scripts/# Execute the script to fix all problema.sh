@@ -1,3 +1,2 @@
 # Execute the script to fix all problematic workflow files at once
-chmod +x .github/scripts/nuclear_fix_workflows.sh
 bash .github/scripts/nuclear_fix_workflows.sh
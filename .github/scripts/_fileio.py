@@ -0,0 +1,61 @@
+"""
+File helpers shared by the fix scripts.
+"""
+
+import json
+import os
+import shutil
+
+
+def atomic_write(path, data, encoding='utf-8', newline=None):
+    """Replace the contents of a file in one step.
+
+    data is written to a temporary file next to path, which is then renamed
+    over it with os.replace, so an interrupted run leaves either the old or
+    the new file, never a truncated one. bytes are written as they are;
+    text is written with the given encoding and newline. When path already
+    exists its permission bits are kept.
+    """
+    tmp = f"{path}.tmp"
+    try:
+        if isinstance(data, bytes):
+            with open(tmp, 'wb') as f:
+                f.write(data)
+        else:
+            with open(tmp, 'w', encoding=encoding, newline=newline) as f:
+                f.write(data)
+        if os.path.exists(path):
+            shutil.copymode(path, tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def stat_key(st):
+    """Return the cache key for a stat result: changes whenever the file does"""
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def load_stat_cache(path):
+    """Load a path -> stat_key cache, or an empty one if missing or unreadable"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_stat_cache(path, cache):
+    """Write a stat_key cache, warning instead of failing if it cannot be saved
+
+    Callers pass a cache rebuilt from the current run only, so entries for
+    files that were deleted or no longer qualify drop out.
+    """
+    try:
+        # Atomic, so an interrupted run cannot leave truncated JSON that the
+        # next load would quietly treat as an empty cache
+        atomic_write(path, json.dumps(cache))
+    except OSError as e:
+        print(f"⚠️ Could not write {path}: {e}")
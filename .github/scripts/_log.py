@@ -0,0 +1,13 @@
+"""
+Console output helpers shared by the fix scripts.
+"""
+
+import threading
+
+_print_lock = threading.Lock()
+
+
+def log(message):
+    """Print a line without interleaving it with output from other worker threads."""
+    with _print_lock:
+        print(message)
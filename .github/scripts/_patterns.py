@@ -0,0 +1,67 @@
+"""
+Patterns and templates shared by the fix scripts.
+"""
+
+import re
+
+# The old repository slug; every stale reference and badge URL contains it
+OLD_REPO_RE = re.compile(r'EosLumina/ThinkAlike')
+
+# What OLD_REPO_RE matches should be replaced with
+NEW_REPO = 'EosLumina/--ThinkAlike--'
+
+# 'on' trigger sections keyed by the workflow file name fragments that select
+# them, checked in order; each ends in a single newline so callers can add
+# whatever spacing their output needs
+TRIGGERS = (
+    (('test', 'ci'), """on:
+  push:
+    branches: [main]
+    paths:
+      - 'backend/**'
+      - 'tests/**'
+      - 'requirements*.txt'
+  pull_request:
+    branches: [main]
+  workflow_dispatch:
+"""),
+    (('deploy', 'cd', 'gh_pages'), """on:
+  push:
+    branches: [main]
+    tags:
+      - 'v*.*.*'
+  workflow_dispatch:
+"""),
+    (('doc',), """on:
+  push:
+    branches: [main]
+    paths:
+      - 'docs/**'
+      - '*.md'
+  pull_request:
+    branches: [main]
+  workflow_dispatch:
+"""),
+    (('settings',), """on:
+  schedule:
+    - cron: "0 0 * * 0"  # Run weekly on Sundays
+  workflow_dispatch:
+"""),
+)
+
+DEFAULT_TRIGGER = """on:
+  push:
+    branches: [main]
+  pull_request:
+    branches: [main]
+  workflow_dispatch:
+"""
+
+
+def pick_trigger(file_path):
+    """Return the 'on' trigger section for a workflow based on its file name"""
+    name = str(file_path).lower()
+    for keywords, trigger in TRIGGERS:
+        if any(keyword in name for keyword in keywords):
+            return trigger
+    return DEFAULT_TRIGGER
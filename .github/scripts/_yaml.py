@@ -0,0 +1,9 @@
+"""
+YAML helpers shared by the workflow scripts.
+"""
+
+# Prefer the libyaml C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
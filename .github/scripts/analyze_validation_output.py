@@ -9,6 +9,13 @@ import re
 import subprocess
 from pathlib import Path
 
+# Per-file sections of the validator output, and the issue bullets inside them
+VALIDATION_RESULT_RE = re.compile(r'===== Validating (.*?) =====.*?Checking.*?\n((?:.*?\n)+?)(?====|$)', re.MULTILINE)
+ISSUE_RE = re.compile(r'- (.*)')
+
+# Number of leading lines shown from each sample file
+PREVIEW_LINES = 15
+
 def analyze_validation_issues():
     """Run the validator and analyze its output"""
     print("Running workflow validator and analyzing output...")
@@ -16,7 +23,7 @@ def analyze_validation_issues():
     # Run the validator and capture its output
     try:
         result = subprocess.run(
-            ["python", ".github/scripts/validate_workflows.py"],
+            [sys.executable, ".github/scripts/validate_workflows.py"],
             capture_output=True,
             text=True,
             check=False
@@ -38,7 +45,7 @@ def analyze_validation_issues():
     print("============================")
 
     # Extract validation results for each file
-    validation_results = re.findall(r'===== Validating (.*?) =====.*?Checking.*?\n((?:.*?\n)+?)(?====|$)', output, re.MULTILINE)
+    validation_results = VALIDATION_RESULT_RE.findall(output)
 
     # Group files by validation status
     valid_files = []
@@ -58,7 +65,7 @@ def analyze_validation_issues():
     if invalid_files:
         print("\n❌ Files with validation issues:")
         for file_path, result_text in invalid_files:
-            issues = re.findall(r'- (.*)', result_text)
+            issues = ISSUE_RE.findall(result_text)
             print(f"  • {file_path}: {', '.join(issues)}")
 
     # Find patterns in valid files to help fix invalid ones
@@ -74,7 +81,8 @@ def analyze_validation_issues():
             print(f"✅ Sample valid file ({valid_path}):")
             print("-" * 40)
             # Print the first few lines that typically contain the "on" section
-            for line in valid_content.split('\n')[:15]:
+            # (bounded split: the rest of the file is never broken into lines)
+            for line in valid_content.split('\n', PREVIEW_LINES)[:PREVIEW_LINES]:
                 print(line)
             print("...")
 
@@ -86,7 +94,7 @@ def analyze_validation_issues():
             print(f"\n❌ Sample invalid file ({invalid_path}):")
             print("-" * 40)
             # Print the first few lines that typically contain the "on" section
-            for line in invalid_content.split('\n')[:15]:
+            for line in invalid_content.split('\n', PREVIEW_LINES)[:PREVIEW_LINES]:
                 print(line)
             print("...")
 
@@ -4,18 +4,23 @@ Safely remove duplicate repository directories.
 """
 
 import os
+import sys
 import shutil
 import argparse
 
 
 def check_is_duplicate(repo_dir):
     """Check if the directory appears to be a duplicate repository."""
-    # Check for typical Git repository indicators
-    git_dir = os.path.join(repo_dir, '.git')
-    readme = os.path.join(repo_dir, 'README.md')
+    # Check for typical Git repository indicators with a single directory
+    # listing rather than one stat call per indicator
+    try:
+        with os.scandir(repo_dir) as entries:
+            names = {entry.name for entry in entries}
+    except OSError:
+        return False
 
     # If it has a .git directory and README.md, it's likely a repository
-    return os.path.exists(git_dir) and os.path.exists(readme)
+    return {'.git', 'README.md'} <= names
 
 
 def safely_remove_duplicate(repo_dir, force=False):
@@ -56,11 +61,20 @@ def main():
         action='store_true',
         help='Force removal even if directory does not appear to be a repository'
     )
+    parser.add_argument(
+        '-y', '--yes',
+        action='store_true',
+        help='Do not ask for confirmation (for CI and other non-interactive use)'
+    )
 
     args = parser.parse_args()
 
-    # Confirm before removal
-    if not args.force:
+    # Confirm before removal. Without a terminal there is nobody to answer,
+    # so refuse instead of blocking on input() until the job times out
+    if not args.force and not args.yes:
+        if not sys.stdin.isatty():
+            print("Not running interactively; pass --yes to confirm removal.")
+            sys.exit(1)
         answer = input(f"Are you sure you want to remove {args.directory}? [y/N] ")
         if answer.lower() != 'y':
             print("Operation cancelled.")
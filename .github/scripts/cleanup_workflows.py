@@ -2,8 +2,6 @@
 """Clean up workflow files by moving old ones to backup."""
 
 import os
-import shutil
-import yaml
 from pathlib import Path
 
 # Constants
@@ -37,16 +35,22 @@ def print_error(msg):
 
 
 def backup_workflow(file_path):
-    """Create a backup of the workflow file."""
+    """Move the workflow file into the backup directory."""
     source = Path(file_path)
     dest = BACKUP_DIR / source.name
     BACKUP_DIR.mkdir(exist_ok=True)
-    shutil.copy2(source, dest)
+    # The backup directory sits inside WORKFLOW_DIR, so a rename is a
+    # metadata-only move; no need to copy the bytes and then unlink
+    os.replace(source, dest)
     print_success(f"Created backup of {source.name}")
 
 
 def load_workflow(file_path):
     """Load and parse a workflow file."""
+    # Imported here: cleanup_workflows() only moves files and never parses
+    # them, so a cleanup run should not pay for (or require) PyYAML
+    import yaml
+
     try:
         with open(file_path, 'r') as f:
             return yaml.safe_load(f)
@@ -62,12 +66,20 @@ def cleanup_workflows():
     # Create backup directory
     BACKUP_DIR.mkdir(exist_ok=True)
 
+    # List the workflows with one scandir pass: the directory entries already
+    # carry name and type, so nothing is stat'ed or pattern-matched per file
+    with os.scandir(WORKFLOW_DIR) as entries:
+        workflow_files = [
+            entry for entry in entries
+            if entry.name.endswith('.yml') and not entry.name.startswith('.')
+            and entry.is_file()
+        ]
+
     # Move non-essential workflows to backup
-    for file_path in WORKFLOW_DIR.glob('*.yml'):
-        if file_path.name not in ESSENTIAL_FILES:
-            backup_workflow(file_path)
-            file_path.unlink()
-            print_success(f"Moved {file_path.name} to backup")
+    for entry in workflow_files:
+        if entry.name not in ESSENTIAL_FILES:
+            backup_workflow(entry.path)
+            print_success(f"Moved {entry.name} to backup")
 
     print_header("Cleanup complete")
     print("Run 'git status' to review changes")
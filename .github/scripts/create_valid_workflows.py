@@ -8,368 +8,47 @@ and includes self-validation to ensure the files pass validation.
 import os
 import sys
 import re
-import yaml
+import subprocess
 from pathlib import Path
 
-# Dictionary of workflow files to create with their content
-WORKFLOW_TEMPLATES = {
-    "consolidated-ci.yml": """name: Consolidated CI
-
-on:
-  push:
-    branches: [main]
-  pull_request:
-    branches: [main]
-  workflow_dispatch:
-
-jobs:
-  test:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Set up Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install pytest
-          if [ -f requirements.txt ]; then pip install -r requirements.txt; fi
-      - name: Test with pytest
-        run: pytest
-""",
-
-    "fixed_consolidated-ci.yml": """name: Consolidated CI (Fixed)
-
-on:
-  push:
-    branches: [main]
-  pull_request:
-    branches: [main]
-  workflow_dispatch:
-
-jobs:
-  test:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Set up Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install pytest
-          if [ -f requirements.txt ]; then pip install -r requirements.txt; fi
-      - name: Test with pytest
-        run: pytest
-""",
-
-    "fixed_run-tests.yml": """name: Run Tests (Fixed)
-
-on:
-  push:
-    branches: [main]
-    paths:
-      - 'backend/**'
-      - 'tests/**'
-      - 'requirements*.txt'
-  pull_request:
-    branches: [main]
-  workflow_dispatch:
-
-jobs:
-  test:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Set up Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install pytest
-          if [ -f requirements.txt]; then pip install -r requirements.txt; fi
-      - name: Test with pytest
-        run: pytest
-""",
-
-    "fixed_documentation.yml": """name: Documentation (Fixed)
-
-on:
-  push:
-    branches: [main]
-    paths:
-      - 'docs/**'
-      - '*.md'
-  pull_request:
-    branches: [main]
-  workflow_dispatch:
-
-jobs:
-  build:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Set up Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install mkdocs
-      - name: Build docs
-        run: mkdocs build
-""",
-
-    "deploy_to_gh_pages.yml": """name: Deploy to GitHub Pages
-
-on:
-  push:
-    branches: [main]
-    paths:
-      - 'docs/**'
-      - '*.md'
-  workflow_dispatch:
-
-jobs:
-  deploy:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Setup Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install mkdocs mkdocs-material
-      - name: Build site
-        run: mkdocs build
-      - name: Deploy
-        uses: peaceiris/actions-gh-pages@v3
-        with:
-          github_token: ${{ secrets.GITHUB_TOKEN }}
-          publish_dir: ./site
-""",
-
-    "fixed_settings.yml": """name: Repository Settings (Fixed)
-
-on:
-  schedule:
-    - cron: "0 0 * * 0"  # Run weekly on Sundays
-  workflow_dispatch:
-
-jobs:
-  settings:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Apply repository settings
-        uses: probot/settings@v1
-        with:
-          settings_file: .github/config/repository-settings.yml
-        env:
-          GITHUB_TOKEN: ${{ secrets.GITHUB_TOKEN }}
-""",
-
-    "fixed_deploy_to_gh_pages.yml": """name: Deploy to GitHub Pages (Fixed)
-
-on:
-  push:
-    branches: [main]
-    paths:
-      - 'docs/**'
-      - '*.md'
-  workflow_dispatch:
-
-jobs:
-  deploy:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Setup Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install mkdocs mkdocs-material
-      - name: Build site
-        run: mkdocs build
-      - name: Deploy
-        uses: peaceiris/actions-gh-pages@v3
-        with:
-          github_token: ${{ secrets.GITHUB_TOKEN }}
-          publish_dir: ./site
-""",
-
-    "unified-workflow.yml": """name: Unified Workflow
-
-on:
-  push:
-    branches: [main]
-  pull_request:
-    branches: [main]
-  workflow_dispatch:
-
-jobs:
-  test:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Set up Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install pytest
-          if [ -f requirements.txt ]; then pip install -r requirements.txt; fi
-      - name: Test with pytest
-        run: pytest
-""",
-
-    "run-tests.yml": """name: Run Tests
-
-on:
-  push:
-    branches: [main]
-    paths:
-      - 'backend/**'
-      - 'tests/**'
-      - 'requirements*.txt'
-  pull_request:
-    branches: [main]
-  workflow_dispatch:
-
-jobs:
-  test:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Set up Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install pytest
-          if [ -f requirements.txt ]; then pip install -r requirements.txt; fi
-      - name: Test with pytest
-        run: pytest
-""",
-
-    "deploy.yml": """name: Deploy
-
-on:
-  push:
-    branches: [main]
-    tags:
-      - 'v*.*.*'
-  workflow_dispatch:
-
-jobs:
-  deploy:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Set up Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          if [ -f requirements.txt ]; then pip install -r requirements.txt; fi
-      - name: Deploy
-        run: echo "Deploying application..."
-""",
-
-    "documentation.yml": """name: Documentation
-
-on:
-  push:
-    branches: [main]
-    paths:
-      - 'docs/**'
-      - '*.md'
-  pull_request:
-    branches: [main]
-  workflow_dispatch:
-
-jobs:
-  build:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Set up Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install mkdocs
-      - name: Build docs
-        run: mkdocs build
-""",
-
-    "settings.yml": """name: Repository Settings
-
-on:
-  schedule:
-    - cron: "0 0 * * 0"  # Run weekly on Sundays
-  workflow_dispatch:
-
-jobs:
-  settings:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Apply repository settings
-        uses: probot/settings@v1
-        with:
-          settings_file: .github/config/repository-settings.yml
-        env:
-          GITHUB_TOKEN: ${{ secrets.GITHUB_TOKEN }}
-""",
-
-    "fixed_deploy.yml": """name: Fixed Deploy
-
-on:
-  push:
-    branches: [main]
-    tags:
-      - 'v*.*.*'
-  workflow_dispatch:
-
-jobs:
-  deploy:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Set up Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          if [ -f requirements.txt ]; then pip install -r requirements.txt; fi
-      - name: Deploy
-        run: echo "Deploying application..."
-"""
-}
+# PyYAML is needed for validation; install it on first use rather than
+# probing for it again on every run of create_workflow_files()
+try:
+    import yaml
+except ImportError:
+    print("Installing PyYAML for validation...")
+    subprocess.check_call([sys.executable, '-m', 'pip', 'install', 'PyYAML'])
+    import yaml
+
+# Known-good workflow bodies live in .github/workflow_templates/known_good/;
+# resolved now because create_workflow_files() may chdir to the repo root
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "workflow_templates" / "known_good"
+
+# Workflow files to create, each from the template of the same name
+WORKFLOW_TEMPLATES = (
+    "consolidated-ci.yml",
+    "fixed_consolidated-ci.yml",
+    "fixed_run-tests.yml",
+    "fixed_documentation.yml",
+    "deploy_to_gh_pages.yml",
+    "fixed_settings.yml",
+    "fixed_deploy_to_gh_pages.yml",
+    "unified-workflow.yml",
+    "run-tests.yml",
+    "deploy.yml",
+    "documentation.yml",
+    "settings.yml",
+    "fixed_deploy.yml",
+)
+
+# Patterns used for every workflow, compiled once at import
+ON_SECTION_RE = re.compile(r'(?:^|\n)\s*on\s*:')
+NAME_RE = re.compile(r'name:\s*([^\n]+)')
+JOBS_SECTION_RE = re.compile(r'jobs:[\s\S]+$')
+
+def load_workflow_template(filename):
+    """Read the known-good content for a workflow file from the templates directory"""
+    return (TEMPLATES_DIR / filename).read_text(encoding='utf-8')
 
 def validate_workflow(file_path):
     """
@@ -381,7 +60,7 @@ def validate_workflow(file_path):
             content = f.read()
 
         # Check for 'on:' section with regex first
-        on_match = re.search(r'(?:^|\n)\s*on\s*:', content)
+        on_match = ON_SECTION_RE.search(content)
         if not on_match:
             print(f"❌ {file_path}: Missing 'on:' section (string check)")
             return False
@@ -417,12 +96,20 @@ def create_and_validate_workflow_file(workflows_dir, filename, content):
     file_path = workflows_dir / filename
 
     try:
-        # Ensure content has proper line endings
-        normalized_content = content.replace('\r\n', '\n').strip() + '\n'
-
-        # Write the file with proper line endings
-        with open(file_path, 'w', encoding='utf-8', newline='\n') as f:
-            f.write(normalized_content)
+        # Ensure content has proper line endings, encoded once for both the
+        # comparison and the write
+        normalized_content = (content.replace('\r\n', '\n').strip() + '\n').encode('utf-8')
+
+        # Write the file with proper line endings, unless it already holds
+        # exactly this content (avoids needless rewrites and git noise).
+        # Reading straight away instead of checking exists() first saves a
+        # stat per file; a missing file simply counts as changed.
+        try:
+            unchanged = file_path.read_bytes() == normalized_content
+        except FileNotFoundError:
+            unchanged = False
+        if not unchanged:
+            file_path.write_bytes(normalized_content)
 
         # Validate the file
         is_valid = validate_workflow(file_path)
@@ -449,11 +136,11 @@ def fix_on_section_manually(file_path):
             content = f.read()
 
         # Extract the name if present
-        name_match = re.search(r'name:\s*([^\n]+)', content)
+        name_match = NAME_RE.search(content)
         name = name_match.group(1).strip() if name_match else "Workflow"
 
         # Extract jobs section if present
-        jobs_match = re.search(r'jobs:[\s\S]+$', content)
+        jobs_match = JOBS_SECTION_RE.search(content)
         jobs_section = jobs_match.group(0) if jobs_match else """jobs:
   build:
     runs-on: ubuntu-latest
@@ -501,19 +188,9 @@ def create_workflow_files():
     invalid_count = 0
     fixed_count = 0
 
-    # Install PyYAML if needed for validation
-    try:
-        import yaml
-    except ImportError:
-        print("Installing PyYAML for validation...")
-        os.system("pip install PyYAML")
-        try:
-            import yaml
-        except ImportError:
-            print("❌ Failed to install PyYAML. Continuing without validation.")
-
-    for filename, content in WORKFLOW_TEMPLATES.items():
+    for filename in WORKFLOW_TEMPLATES:
         file_path = workflows_dir / filename
+        content = load_workflow_template(filename)
 
         # Create and validate the file
         if create_and_validate_workflow_file(workflows_dir, filename, content):
@@ -570,7 +247,10 @@ jobs:
 
         # Run validation script if it exists
         if os.path.exists(".github/scripts/validate_workflows.py"):
-            os.system("python .github/scripts/validate_workflows.py .github/workflows/emergency_test.yml")
+            # argv list, no shell: one process instead of sh plus python, and
+            # the same interpreter that is running this script
+            subprocess.run([sys.executable, ".github/scripts/validate_workflows.py",
+                            ".github/workflows/emergency_test.yml"])
     except Exception as e:
         print(f"❌ Failed to create emergency test workflow: {e}")
 
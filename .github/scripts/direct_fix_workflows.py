@@ -6,10 +6,12 @@ prepending the trigger section rather than trying to parse and modify the files.
 """
 
 import os
-import yaml
 import sys
 from pathlib import Path
 
+from _fileio import atomic_write
+from _patterns import pick_trigger
+
 def fix_workflow_file(file_path):
     """
     Fix a workflow file by directly prepending the 'on' trigger section.
@@ -24,72 +26,22 @@ def fix_workflow_file(file_path):
             return False  # Already has an 'on' trigger
 
         # Determine appropriate trigger based on file name
-        if 'test' in file_path.lower() or 'ci' in file_path.lower():
-            trigger = """on:
-  push:
-    branches: [main]
-    paths:
-      - 'backend/**'
-      - 'tests/**'
-      - 'requirements*.txt'
-  pull_request:
-    branches: [main]
-  workflow_dispatch:
-
-"""
-        elif 'deploy' in file_path.lower() or 'cd' in file_path.lower() or 'gh_pages' in file_path.lower():
-            trigger = """on:
-  push:
-    branches: [main]
-    tags:
-      - 'v*.*.*'
-  workflow_dispatch:
-
-"""
-        elif 'doc' in file_path.lower():
-            trigger = """on:
-  push:
-    branches: [main]
-    paths:
-      - 'docs/**'
-      - '*.md'
-  pull_request:
-    branches: [main]
-  workflow_dispatch:
-
-"""
-        elif 'settings' in file_path.lower():
-            trigger = """on:
-  schedule:
-    - cron: "0 0 * * 0"  # Run weekly on Sundays
-  workflow_dispatch:
-
-"""
+        trigger = pick_trigger(file_path) + '\n'
+
+        # Build the complete new file. If there's a name line, keep it at
+        # the top
+        if content.startswith('name:'):
+            name_end = content.find('\n')
+            if name_end != -1:
+                new_content = content[:name_end+1] + '\n' + trigger + content[name_end+1:]
+            else:
+                new_content = content + '\n' + trigger
         else:
-            # Default trigger
-            trigger = """on:
-  push:
-    branches: [main]
-  pull_request:
-    branches: [main]
-  workflow_dispatch:
+            new_content = trigger + content
 
-"""
-
-        # Create a completely new file
-        with open(file_path, 'w') as f:
-            # If there's a name line, keep it at the top
-            if content.startswith('name:'):
-                name_end = content.find('\n')
-                if name_end != -1:
-                    f.write(content[:name_end+1] + '\n')
-                    f.write(trigger)
-                    f.write(content[name_end+1:])
-                else:
-                    f.write(content + '\n')
-                    f.write(trigger)
-            else:
-                f.write(trigger + content)
+        # Write it in one go, so a failure never leaves a half-written
+        # workflow behind
+        atomic_write(file_path, new_content, encoding=None)
 
         print(f"✅ Fixed {file_path}")
         return True
@@ -9,102 +9,25 @@ from pathlib import Path
 import sys
 import re
 
-def write_workflow(file_path, content):
-    """Write content to a file, ensuring it has standard line endings"""
-    try:
-        # Normalize line endings to Unix style
-        content = content.replace('\r\n', '\n')
-
-        # Ensure there's no BOM or other encoding issues
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-
-        print(f"✅ Wrote file: {file_path}")
-        return True
-    except Exception as e:
-        print(f"❌ Error writing {file_path}: {e}")
-        return False
-
-def fix_workflows():
-    """Fix all workflow files with validation issues"""
-    # Ensure we're in the repository root
-    if os.path.exists('../.git') and not os.path.exists('.git'):
-        os.chdir('..')
+from _fileio import atomic_write
 
-    workflows_dir = Path(".github/workflows")
-
-    if not workflows_dir.exists():
-        print(f"Error: .github/workflows directory not found in {os.getcwd()}")
-        return False
-
-    # Create a marker to determine if we made any changes
-    fixed_count = 0
-
-    # Fix consolidated-ci.yml
-    consolidated_ci_content = """name: Consolidated CI
+# Every workflow shares this skeleton; only the name, the trigger events
+# (workflow_dispatch is always added) and the jobs block differ.
+WORKFLOW_TEMPLATE = """name: {name}
 
 on:
-  push:
-    branches: [main]
-  pull_request:
-    branches: [main]
-  workflow_dispatch:
+{triggers}  workflow_dispatch:
 
 jobs:
-  test:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Set up Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install pytest
-          if [ -f requirements.txt ]; then pip install -r requirements.txt; fi
-      - name: Test with pytest
-        run: pytest
-"""
-    if write_workflow(workflows_dir / "consolidated-ci.yml", consolidated_ci_content):
-        fixed_count += 1
-
-    # Fix fixed_consolidated-ci.yml
-    fixed_consolidated_ci_content = """name: Consolidated CI (Fixed)
+{jobs}"""
 
-on:
-  push:
+TRIGGERS = {
+    "default": """  push:
     branches: [main]
   pull_request:
     branches: [main]
-  workflow_dispatch:
-
-jobs:
-  test:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Set up Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install pytest
-          if [ -f requirements.txt ]; then pip install -r requirements.txt; fi
-      - name: Test with pytest
-        run: pytest
-"""
-    if write_workflow(workflows_dir / "fixed_consolidated-ci.yml", fixed_consolidated_ci_content):
-        fixed_count += 1
-
-    # Fix fixed_run-tests.yml
-    fixed_run_tests_content = """name: Run Tests (Fixed)
-
-on:
-  push:
+""",
+    "tests": """  push:
     branches: [main]
     paths:
       - 'backend/**'
@@ -112,288 +35,70 @@ on:
       - 'requirements*.txt'
   pull_request:
     branches: [main]
-  workflow_dispatch:
-
-jobs:
-  test:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Set up Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install pytest
-          if [ -f requirements.txt ]; then pip install -r requirements.txt; fi
-      - name: Test with pytest
-        run: pytest
-"""
-    if write_workflow(workflows_dir / "fixed_run-tests.yml", fixed_run_tests_content):
-        fixed_count += 1
-
-    # Fix fixed_documentation.yml
-    fixed_documentation_content = """name: Documentation (Fixed)
-
-on:
-  push:
+""",
+    "docs": """  push:
     branches: [main]
     paths:
       - 'docs/**'
       - '*.md'
   pull_request:
     branches: [main]
-  workflow_dispatch:
-
-jobs:
-  build:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Set up Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install mkdocs
-      - name: Build docs
-        run: mkdocs build
-"""
-    if write_workflow(workflows_dir / "fixed_documentation.yml", fixed_documentation_content):
-        fixed_count += 1
-
-    # Fix deploy_to_gh_pages.yml
-    deploy_to_gh_pages_content = """name: Deploy to GitHub Pages
-
-on:
-  push:
+""",
+    "pages": """  push:
     branches: [main]
     paths:
       - 'docs/**'
       - '*.md'
-  workflow_dispatch:
-
-jobs:
-  deploy:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Setup Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install mkdocs mkdocs-material
-      - name: Build site
-        run: mkdocs build
-      - name: Deploy
-        uses: peaceiris/actions-gh-pages@v3
-        with:
-          github_token: ${{ secrets.GITHUB_TOKEN }}
-          publish_dir: ./site
-"""
-    if write_workflow(workflows_dir / "deploy_to_gh_pages.yml", deploy_to_gh_pages_content):
-        fixed_count += 1
-
-    # Fix fixed_settings.yml
-    fixed_settings_content = """name: Repository Settings (Fixed)
-
-on:
-  schedule:
-    - cron: "0 0 * * 0"  # Run weekly on Sundays
-  workflow_dispatch:
-
-jobs:
-  settings:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Apply repository settings
-        uses: probot/settings@v1
-        with:
-          settings_file: .github/config/repository-settings.yml
-        env:
-          GITHUB_TOKEN: ${{ secrets.GITHUB_TOKEN }}
-"""
-    if write_workflow(workflows_dir / "fixed_settings.yml", fixed_settings_content):
-        fixed_count += 1
-
-    # Fix fixed_deploy_to_gh_pages.yml
-    fixed_deploy_to_gh_pages_content = """name: Deploy to GitHub Pages (Fixed)
-
-on:
-  push:
+""",
+    "release": """  push:
     branches: [main]
-    paths:
-      - 'docs/**'
-      - '*.md'
-  workflow_dispatch:
+    tags:
+      - 'v*.*.*'
+""",
+    "weekly": """  schedule:
+    - cron: "0 0 * * 0"  # Run weekly on Sundays
+""",
+}
 
-jobs:
-  deploy:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Setup Python
+PY_SETUP = """      - uses: actions/checkout@v3
+      - name: {label}
         uses: actions/setup-python@v4
         with:
           python-version: '3.10'
       - name: Install dependencies
         run: |
           python -m pip install --upgrade pip
-          pip install mkdocs mkdocs-material
-      - name: Build site
-        run: mkdocs build
-      - name: Deploy
-        uses: peaceiris/actions-gh-pages@v3
-        with:
-          github_token: ${{ secrets.GITHUB_TOKEN }}
-          publish_dir: ./site
 """
-    if write_workflow(workflows_dir / "fixed_deploy_to_gh_pages.yml", fixed_deploy_to_gh_pages_content):
-        fixed_count += 1
-
-    # Fix unified-workflow.yml
-    unified_workflow_content = """name: Unified Workflow
 
-on:
-  push:
-    branches: [main]
-  pull_request:
-    branches: [main]
-  workflow_dispatch:
-
-jobs:
-  test:
+JOBS = {
+    "pytest": """  test:
     runs-on: ubuntu-latest
     steps:
-      - uses: actions/checkout@v3
-      - name: Set up Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install pytest
+""" + PY_SETUP.format(label="Set up Python") + """          pip install pytest
           if [ -f requirements.txt ]; then pip install -r requirements.txt; fi
       - name: Test with pytest
         run: pytest
-"""
-    if write_workflow(workflows_dir / "unified-workflow.yml", unified_workflow_content):
-        fixed_count += 1
-
-    # Fix run-tests.yml
-    run_tests_content = """name: Run Tests
-
-on:
-  push:
-    branches: [main]
-    paths:
-      - 'backend/**'
-      - 'tests/**'
-      - 'requirements*.txt'
-  pull_request:
-    branches: [main]
-  workflow_dispatch:
-
-jobs:
-  test:
+""",
+    "mkdocs": """  build:
     runs-on: ubuntu-latest
     steps:
-      - uses: actions/checkout@v3
-      - name: Set up Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install pytest
-          if [ -f requirements.txt ]; then pip install -r requirements.txt; fi
-      - name: Test with pytest
-        run: pytest
-"""
-    if write_workflow(workflows_dir / "run-tests.yml", run_tests_content):
-        fixed_count += 1
-
-    # Fix deploy.yml
-    deploy_content = """name: Deploy
-
-on:
-  push:
-    branches: [main]
-    tags:
-      - 'v*.*.*'
-  workflow_dispatch:
-
-jobs:
-  deploy:
+""" + PY_SETUP.format(label="Set up Python") + """          pip install mkdocs
+      - name: Build docs
+        run: mkdocs build
+""",
+    "pages": """  deploy:
     runs-on: ubuntu-latest
     steps:
-      - uses: actions/checkout@v3
-      - name: Set up Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          if [ -f requirements.txt ]; then pip install -r requirements.txt; fi
+""" + PY_SETUP.format(label="Setup Python") + """          pip install mkdocs mkdocs-material
+      - name: Build site
+        run: mkdocs build
       - name: Deploy
-        run: echo "Deploying application..."
-"""
-    if write_workflow(workflows_dir / "deploy.yml", deploy_content):
-        fixed_count += 1
-
-    # Fix documentation.yml
-    documentation_content = """name: Documentation
-
-on:
-  push:
-    branches: [main]
-    paths:
-      - 'docs/**'
-      - '*.md'
-  pull_request:
-    branches: [main]
-  workflow_dispatch:
-
-jobs:
-  build:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Set up Python
-        uses: actions/setup-python@v4
+        uses: peaceiris/actions-gh-pages@v3
         with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install mkdocs
-      - name: Build docs
-        run: mkdocs build
-"""
-    if write_workflow(workflows_dir / "documentation.yml", documentation_content):
-        fixed_count += 1
-
-    # Fix settings.yml
-    settings_content = """name: Repository Settings
-
-on:
-  schedule:
-    - cron: "0 0 * * 0"  # Run weekly on Sundays
-  workflow_dispatch:
-
-jobs:
-  settings:
+          github_token: ${{ secrets.GITHUB_TOKEN }}
+          publish_dir: ./site
+""",
+    "settings": """  settings:
     runs-on: ubuntu-latest
     steps:
       - uses: actions/checkout@v3
@@ -403,38 +108,90 @@ jobs:
           settings_file: .github/config/repository-settings.yml
         env:
           GITHUB_TOKEN: ${{ secrets.GITHUB_TOKEN }}
-"""
-    if write_workflow(workflows_dir / "settings.yml", settings_content):
-        fixed_count += 1
-
-    # Fix fixed_deploy.yml
-    fixed_deploy_content = """name: Fixed Deploy
-
-on:
-  push:
-    branches: [main]
-    tags:
-      - 'v*.*.*'
-  workflow_dispatch:
-
-jobs:
-  deploy:
+""",
+    "deploy": """  deploy:
     runs-on: ubuntu-latest
     steps:
-      - uses: actions/checkout@v3
-      - name: Set up Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          if [ -f requirements.txt ]; then pip install -r requirements.txt; fi
+""" + PY_SETUP.format(label="Set up Python") + """          if [ -f requirements.txt ]; then pip install -r requirements.txt; fi
       - name: Deploy
         run: echo "Deploying application..."
-"""
-    if write_workflow(workflows_dir / "fixed_deploy.yml", fixed_deploy_content):
-        fixed_count += 1
+""",
+}
+
+# (workflow name, trigger key, job key) for each file to rewrite
+JOB_CONFIGS = {
+    "consolidated-ci.yml": ("Consolidated CI", "default", "pytest"),
+    "fixed_consolidated-ci.yml": ("Consolidated CI (Fixed)", "default", "pytest"),
+    "fixed_run-tests.yml": ("Run Tests (Fixed)", "tests", "pytest"),
+    "fixed_documentation.yml": ("Documentation (Fixed)", "docs", "mkdocs"),
+    "deploy_to_gh_pages.yml": ("Deploy to GitHub Pages", "pages", "pages"),
+    "fixed_settings.yml": ("Repository Settings (Fixed)", "weekly", "settings"),
+    "fixed_deploy_to_gh_pages.yml": ("Deploy to GitHub Pages (Fixed)", "pages", "pages"),
+    "unified-workflow.yml": ("Unified Workflow", "default", "pytest"),
+    "run-tests.yml": ("Run Tests", "tests", "pytest"),
+    "deploy.yml": ("Deploy", "release", "deploy"),
+    "documentation.yml": ("Documentation", "docs", "mkdocs"),
+    "settings.yml": ("Repository Settings", "weekly", "settings"),
+    "fixed_deploy.yml": ("Fixed Deploy", "release", "deploy"),
+}
+
+# Rendered, normalized to Unix line endings and UTF-8 encoded once at import
+# time, so writing or comparing a workflow is a plain bytes operation
+WORKFLOWS = {
+    filename: WORKFLOW_TEMPLATE.format(
+        name=name, triggers=TRIGGERS[trigger], jobs=JOBS[job]
+    ).replace('\r\n', '\n').encode('utf-8')
+    for filename, (name, trigger, job) in JOB_CONFIGS.items()
+}
+
+def write_workflow(file_path, content, msgs):
+    """Write content (UTF-8 bytes with Unix line endings) to a file.
+
+    Status lines are appended to ``msgs`` rather than printed, so the caller
+    can emit them in a single write once all files are done.
+    """
+    try:
+        # Leave files that already hold exactly this content alone: no disk
+        # write, and no mtime change or git noise for unchanged workflows
+        try:
+            unchanged = Path(file_path).read_bytes() == content
+        except FileNotFoundError:
+            unchanged = False
+        if unchanged:
+            msgs.append(f"✅ Already up to date: {file_path}")
+            return True
+
+        # Ensure there's no BOM or other encoding issues, and never leave a
+        # truncated workflow behind if we are interrupted mid-write
+        atomic_write(file_path, content)
+
+        msgs.append(f"✅ Wrote file: {file_path}")
+        return True
+    except Exception as e:
+        msgs.append(f"❌ Error writing {file_path}: {e}")
+        return False
+
+def fix_workflows():
+    """Fix all workflow files with validation issues"""
+    # Ensure we're in the repository root
+    if os.path.exists('../.git') and not os.path.exists('.git'):
+        os.chdir('..')
+
+    workflows_dir = Path(".github/workflows")
+
+    if not workflows_dir.exists():
+        print(f"Error: .github/workflows directory not found in {os.getcwd()}")
+        return False
+
+    # Create a marker to determine if we made any changes
+    fixed_count = 0
+    msgs = []
+
+    for filename, content in WORKFLOWS.items():
+        if write_workflow(workflows_dir / filename, content, msgs):
+            fixed_count += 1
+
+    sys.stdout.write("\n".join(msgs) + "\n")
 
     print(f"\n🎉 Fixed {fixed_count} workflow files")
     print("Run validation to check if all issues are resolved:")
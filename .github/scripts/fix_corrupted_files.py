@@ -1,4 +1,8 @@
+import mmap
+import os
 import pathlib
+import re
+from concurrent.futures import ThreadPoolExecutor
 
 files = [
     'backend/app/development/ai_application_developer.py',
@@ -6,10 +10,46 @@ files = [
     'backend/app/services/value_based_matcher.py'
 ]
 
-for f in files:
+NON_NULL_RUN = re.compile(rb'[^\x00]+')
+
+
+def strip_nulls_in_place(p):
+    """Remove null bytes from p in place; return True if there were any.
+
+    The file is compacted inside a writable mmap and then truncated, so it is
+    never held in memory as separate before/after copies.
+    """
+    with open(p, 'r+b') as fh:
+        # mmap cannot map an empty file, and an empty file has no nulls
+        if os.fstat(fh.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(fh.fileno(), 0) as mm:
+            if mm.find(b'\x00') == -1:
+                return False
+            # Slide each run of non-null bytes down over the gaps left by nulls;
+            # writes only ever land on bytes the scan has already passed
+            dst = 0
+            for run in NON_NULL_RUN.finditer(mm):
+                start, end = run.span()
+                if start != dst:
+                    mm.move(dst, start, end - start)
+                dst += end - start
+            mm.flush()
+        fh.truncate(dst)
+    return True
+
+
+def fix_one(f):
+    """Scrub one listed file; return its status line, or None if it is missing."""
     p = pathlib.Path(f)
     if p.exists():
-        content = p.read_bytes()
-        fixed = content.replace(b'\x00', b'')
-        p.write_bytes(fixed)
-        print(f'Fixed {f}' if content != fixed else f'No nulls in {f}')
+        return f'Fixed {f}' if strip_nulls_in_place(p) else f'No nulls in {f}'
+    return None
+
+
+# Each file is independent disk I/O, so overlap them; map() keeps the
+# status lines in list order
+with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+    for message in executor.map(fix_one, files):
+        if message:
+            print(message)
@@ -5,10 +5,17 @@ Fixes repository references and badges in markdown files.
 """
 
 import os
-import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from _fileio import atomic_write
+from _log import log
+from _patterns import OLD_REPO_RE, NEW_REPO
+
+# Below this many files a thread pool costs more to start than it saves
+PARALLEL_MIN_FILES = 4
+
 
 def fix_markdown_file(file_path):
     """Fix repository references and badges in a markdown file."""
@@ -19,25 +26,20 @@ def fix_markdown_file(file_path):
         # Save original content to check if changes were made
         original_content = content
 
-        # Fix repository references
-        content = re.sub(r'EosLumina/ThinkAlike', r'EosLumina/--ThinkAlike--', content)
-
-        # Fix badge URLs
-        badge_pattern = r'\[\!\[(.*?)\]\((https://github\.com/EosLumina/ThinkAlike/.*?)\)\]\((.*?)\)'
-        badge_replacement = r'[![\1](https://github.com/EosLumina/--ThinkAlike--\2)](https://github.com/EosLumina/--ThinkAlike--\3)'
-        content = re.sub(badge_pattern, badge_replacement, content)
+        # Fix repository references and badge URLs in one scan: every badge
+        # URL this script targets contains the old repository slug
+        content = OLD_REPO_RE.sub(NEW_REPO, content)
 
         # Only write back if changes were made
         if original_content != content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print(f"✅ Fixed {file_path}")
+            atomic_write(file_path, content)
+            log(f"✅ Fixed {file_path}")
             return True
         else:
-            print(f"No changes needed in {file_path}")
+            log(f"No changes needed in {file_path}")
             return False
     except Exception as e:
-        print(f"Error processing {file_path}: {e}")
+        log(f"Error processing {file_path}: {e}")
         return False
 
 
@@ -47,10 +49,12 @@ def main():
 
     print("Fixing markdown files...")
 
-    fixed_count = 0
-    for file in files_to_fix:
-        if fix_markdown_file(file):
-            fixed_count += 1
+    if len(files_to_fix) < PARALLEL_MIN_FILES:
+        fixed_count = sum(map(fix_markdown_file, files_to_fix))
+    else:
+        # Each file is independent I/O, so overlap them
+        with ThreadPoolExecutor(max_workers=min(8, len(files_to_fix))) as executor:
+            fixed_count = sum(executor.map(fix_markdown_file, files_to_fix))
 
     print(f"Fixed {fixed_count} file(s)")
 
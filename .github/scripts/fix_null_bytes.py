@@ -6,7 +6,6 @@ Fix Python files containing null bytes, which cause 'ValueError: source code str
 import os
 import re
 import sys
-from pathlib import Path
 
 def fix_file_null_bytes(file_path):
     """Remove null bytes from a file."""
@@ -50,15 +49,21 @@ def fix_file_null_bytes(file_path):
         print(f"⚠️ Error processing {file_path}: {e}")
         return False
 
-def main():
+def main(argv=None):
     """Fix null bytes in Python files."""
     # Get list of Python files specified as arguments or scan tests/ directory
-    files_to_fix = sys.argv[1:] if len(sys.argv) > 1 else []
+    files_to_fix = list(sys.argv[1:] if argv is None else argv)
 
     if not files_to_fix:
         print("Scanning for Python files in tests/ directory...")
-        test_files = Path('tests').glob('**/*.py')
-        files_to_fix = [str(f) for f in test_files]
+        # Walk with plain strings; building a Path per entry only to turn
+        # it back into a str is wasted work on large test trees
+        files_to_fix = [
+            os.path.join(root, name)
+            for root, _, files in os.walk('tests')
+            for name in files
+            if name.endswith('.py')
+        ]
 
     if not files_to_fix:
         print("No Python files found to fix.")
@@ -6,52 +6,75 @@ More aggressive script to fix null bytes in test files that cause
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from _fileio import load_stat_cache, save_stat_cache, stat_key
+
+# Remembers files already known to be free of null bytes, keyed by path with
+# their mtime and size, so that reruns only open files that have changed
+CACHE_FILE = Path('.fixnullcache')
+
+# Body written over each unrecoverable test file; only the module name varies,
+# so the text is a fixed template filled in with str.format
+PLACEHOLDER_TEST = '''# Clean file recreated to fix null bytes issue
+"""
+Test module for {module_name}
+"""
+
+def test_placeholder():
+    """Placeholder test until the module is properly implemented."""
+    assert True
+'''
+
 def fix_file_with_null_bytes(file_path):
-    """Remove null bytes from a file using direct binary replacement."""
-    print(f"Processing {file_path}...")
+    """Remove null bytes from a file using direct binary replacement.
+
+    Returns a (fixed, messages) pair instead of printing, so that output stays
+    grouped per file when files are processed by a pool of workers. fixed is
+    None if the file could not be processed.
+    """
+    messages = [f"Processing {file_path}..."]
     try:
-        # Read the file in binary mode
-        with open(file_path, 'rb') as f:
-            content = f.read()
-
-        # Check for null bytes in binary content
-        if b'\x00' in content:
-            print(f"Found null bytes in {file_path}")
-            # Replace all null bytes
-            cleaned_content = content.replace(b'\x00', b'')
-
-            # Write the cleaned content back to the file
-            with open(file_path, 'wb') as f:
-                f.write(cleaned_content)
-
-            # Verify the fix worked
-            with open(file_path, 'rb') as f:
-                verify = f.read()
-                if b'\x00' not in verify:
-                    print(f"✅ Successfully fixed {file_path}")
-                    return True
-                else:
-                    print(f"❌ Failed to fix {file_path} - null bytes still present")
-                    return False
+        path = Path(file_path)
+        content = path.read_bytes()
+
+        # Strip null bytes in one C-level pass; an unchanged length means
+        # there were none and nothing needs writing
+        cleaned_content = content.translate(None, b'\x00')
+        if len(cleaned_content) != len(content):
+            messages.append(f"Found null bytes in {file_path}")
+            path.write_bytes(cleaned_content)
+            # translate() removed every null byte, so there is nothing to
+            # verify by reading the file back
+            messages.append(f"✅ Successfully fixed {file_path}")
+            return True, messages
         else:
-            # Now check using string method (more thorough)
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                text_content = f.read()
-                if '\0' in text_content:
-                    print(f"Found null bytes in text content of {file_path}")
-                    text_content = text_content.replace('\0', '')
-                    with open(file_path, 'w', encoding='utf-8') as fw:
-                        fw.write(text_content)
-                    print(f"✅ Fixed text null bytes in {file_path}")
-                    return True
-                else:
-                    print(f"No null bytes found in {file_path}")
-                    return False
+            # No need to re-read in text mode: UTF-8 only ever encodes U+0000
+            # as a 0x00 byte, so the decoded text cannot contain one either
+            messages.append(f"No null bytes found in {file_path}")
+            return False, messages
     except Exception as e:
-        print(f"⚠️ Error processing {file_path}: {e}")
-        return False
+        messages.append(f"⚠️ Error processing {file_path}: {e}")
+        return None, messages
+
+def find_test_files(directory):
+    """Yield DirEntry objects for .py files under directory, top level first.
+
+    Handing back the DirEntry rather than a path lets callers reuse its
+    file type and cached stat() result instead of querying the file again.
+    """
+    subdirs = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            # Like os.walk: do not descend into symlinked directories
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.endswith('.py') and not entry.name.startswith('.'):
+                # Skip dot-files such as editor swap and backup copies
+                yield entry
+    for subdir in subdirs:
+        yield from find_test_files(subdir)
 
 def main():
     """Fix test files with null bytes using binary mode."""
@@ -61,11 +84,7 @@ def main():
         return False
 
     # Get list of Python files in the tests directory
-    files_to_fix = []
-    for root, _, files in os.walk(test_dir):
-        for file in files:
-            if file.endswith('.py'):
-                files_to_fix.append(os.path.join(root, file))
+    files_to_fix = list(find_test_files(test_dir))
 
     if not files_to_fix:
         print("No test files found!")
@@ -84,26 +103,47 @@ def main():
     # Create minimal versions of problematic files
     for file in problematic_files:
         print(f"Recreating {file}...")
-        with open(file, 'w', encoding='utf-8') as f:
-            filename = os.path.basename(file)
-            module_name = filename[:-3]
-            f.write(f"""# Clean file recreated to fix null bytes issue
-\"\"\"
-Test module for {module_name}
-\"\"\"
-
-def test_placeholder():
-    \"\"\"Placeholder test until the module is properly implemented.\"\"\"
-    assert True
-""")
+        module_name = os.path.basename(file)[:-3]
+        Path(file).write_text(PLACEHOLDER_TEST.format(module_name=module_name),
+                              encoding='utf-8')
         print(f"✅ Recreated {file}")
 
-    # Process all remaining files
+    # Process all remaining files, skipping the ones we already recreated and
+    # empty files, which cannot hold null bytes
+    remaining = []
+    cache = load_stat_cache(CACHE_FILE)
+    new_cache = {}
+    for entry in files_to_fix:
+        if entry.path in problematic_files:
+            continue
+        st = entry.stat()
+        if not st.st_size:
+            continue
+        # Unchanged since a previous run found it clean: no need to open it
+        key = stat_key(st)
+        if cache.get(entry.path) == key:
+            new_cache[entry.path] = key
+            continue
+        remaining.append(entry.path)
+
+    skipped = len(new_cache)
+    if skipped:
+        print(f"Skipping {skipped} unchanged files already known to be clean")
+
+    # Each file is independent I/O plus a C-level translate, so overlap them;
+    # map() keeps the output in file order
     fixed_count = 0
-    for file in files_to_fix:
-        if file not in problematic_files:  # Skip files we already recreated
-            if fix_file_with_null_bytes(file):
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as executor:
+        results = executor.map(fix_file_with_null_bytes, remaining)
+        for file, (fixed, messages) in zip(remaining, results):
+            print('\n'.join(messages))
+            if fixed:
                 fixed_count += 1
+            if fixed is not None:
+                # Stat again: fixing the file changed its mtime and size
+                new_cache[file] = stat_key(os.stat(file))
+
+    save_stat_cache(CACHE_FILE, new_cache)
 
     print(f"Fixed or recreated {fixed_count + len(problematic_files)} files")
     return True
@@ -20,8 +20,8 @@ def fix_file_with_null_bytes(file_path):
         # Check for null bytes in binary content
         if b'\x00' in content:
             print(f"Found null bytes in {file_path}")
-            # Replace null bytes
-            cleaned_content = content.replace(b'\x00', b'')
+            # Strip null bytes in a single C-level pass
+            cleaned_content = content.translate(None, b'\x00')
 
             # Write back in binary mode
             with open(file_path, 'wb') as f:
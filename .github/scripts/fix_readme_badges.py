@@ -3,7 +3,8 @@
 Fix README.md badges to ensure they use the correct repository reference.
 """
 
-import re
+from _fileio import atomic_write
+from _patterns import OLD_REPO_RE, NEW_REPO
 
 def fix_readme_badges():
     """Fix repository references in README.md badges."""
@@ -13,20 +14,15 @@ def fix_readme_badges():
         with open(readme_path, 'r', encoding='utf-8') as f:
             content = f.read()
 
-        # Fix repository references in badges
-        incorrect_pattern = r'EosLumina/ThinkAlike'
-        correct_pattern = r'EosLumina/--ThinkAlike--'
-
         # Save original content to check if changes are made
         original_content = content
 
-        # Replace all occurrences
-        content = re.sub(incorrect_pattern, correct_pattern, content)
+        # Fix repository references in badges
+        content = OLD_REPO_RE.sub(NEW_REPO, content)
 
         # Write back if changes were made
         if original_content != content:
-            with open(readme_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            atomic_write(readme_path, content)
             print(f"✓ Fixed badges in {readme_path}")
             return True
         else:
@@ -1,6 +1,12 @@
+import mmap
 import os
 import re
+import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from _fileio import atomic_write
+from _log import log
 
 OLD_REPO_PATTERNS = [
     "EosLumina/ThinkAlike", # Incorrect format
@@ -9,31 +15,48 @@ OLD_REPO_PATTERNS = [
     # "EosLumina/--ThinkAlike--",
 ]
 CORRECT_REPO = "EosLumina/--ThinkAlike--" # Keep the current correct name
+# One alternation over all old names, so the content is scanned once instead of once per pattern
+OLD_REPO_RE = re.compile('|'.join(map(re.escape, OLD_REPO_PATTERNS)))
+MAX_WORKERS = 64 # Cap on files being read concurrently
+BINARY_SNIFF_BYTES = 512 # Leading bytes checked for a null to detect binary files
 
 def fix_references_in_file(file_path):
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f: # Ignore decoding errors
-            content = f.read()
+        with open(file_path, 'rb') as f:
+            # mmap refuses empty files, and there is nothing to fix in them anyway
+            if os.fstat(f.fileno()).st_size == 0:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # A null byte near the start marks a binary file (the same test
+                # git uses); skip those before scanning the whole mapping
+                if mm.find(b'\x00', 0, BINARY_SNIFF_BYTES) != -1:
+                    return False
+                # Every pattern below includes the owner prefix; most files never
+                # mention it, so search the raw bytes and only decode the few that do
+                if mm.find(b'EosLumina/') == -1:
+                    return False
+                data = mm[:]
     except Exception as e:
         # Ignore files that can't be read (e.g., binary or permission issues)
-        # print(f"Could not read {file_path}: {e}") # Optional: for debugging
+        # log(f"Could not read {file_path}: {e}") # Optional: for debugging
         return False
 
+    # Decode as text mode would: ignore decoding errors, universal newlines
+    content = data.decode('utf-8', errors='ignore').replace('\r\n', '\n').replace('\r', '\n')
+
     original_content = content
     fixed = False
-    found_patterns = []
 
     # Check for potential incorrect references if they point to the *wrong* repo name format
-    for pattern in OLD_REPO_PATTERNS:
-         # Basic string check
-         if pattern in content:
-              found_patterns.append(pattern)
-              # Automatic replacement is risky, just report for now
-              # content = content.replace(pattern, CORRECT_REPO)
-              # fixed = True
+    matched = {m.group(0) for m in OLD_REPO_RE.finditer(content)}
+    # Keep the report in OLD_REPO_PATTERNS order
+    found_patterns = [pattern for pattern in OLD_REPO_PATTERNS if pattern in matched]
+    # Automatic replacement is risky, just report for now
+    # content = OLD_REPO_RE.sub(CORRECT_REPO, content)
+    # fixed = True
 
     if found_patterns:
-        print(f"Found potential incorrect reference(s) {found_patterns} in {file_path}. Manual review recommended.")
+        log(f"Found potential incorrect reference(s) {found_patterns} in {file_path}. Manual review recommended.")
         # If you decide to enable auto-fixing later, uncomment the replace logic above
 
 
@@ -46,7 +69,7 @@ def fix_references_in_file(file_path):
         prefix = match.group(2)
         suffix = match.group(3)
         new_url = f'{prefix}{CORRECT_REPO}{suffix}'
-        print(f"  Updating badge URL in {file_path} to {new_url}")
+        log(f"  Updating badge URL in {file_path} to {new_url}")
         return f'![{badge_text}]({new_url})'
 
     new_content_badges, num_badge_subs = re.subn(badge_pattern, replace_badge, content)
@@ -57,34 +80,80 @@ def fix_references_in_file(file_path):
 
     if fixed:
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print(f"Automatically fixed badge URLs in: {file_path}")
+            atomic_write(file_path, content)
+            log(f"Automatically fixed badge URLs in: {file_path}")
             return True
         except Exception as e:
-            print(f"Error writing fixed file {file_path}: {e}")
+            log(f"Error writing fixed file {file_path}: {e}")
             # Revert content in memory if write fails? Maybe not necessary for this script.
             return False
     return False # Return False if only found patterns were detected but not auto-fixed
 
+def find_target_files(directory, target_extensions, ignore_dirs):
+    """Yield paths of files with a target extension, skipping ignored and hidden dirs.
+
+    Uses os.scandir directly so the file/dir type comes from the cached
+    DirEntry instead of building per-directory name lists as os.walk does.
+    """
+    pending = [directory]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Like os.walk, never descend through symlinked directories
+                        if (not entry.is_symlink() and entry.name not in ignore_dirs
+                                and not entry.name.startswith('.')):
+                            pending.append(entry.path)
+                    elif entry.name.endswith(target_extensions):
+                        yield entry.path
+        except OSError:
+            # Unreadable directory; os.walk skipped these silently too
+            continue
+
+def git_grep_candidates(directory, target_extensions, ignore_dirs):
+    """List files under directory that mention the owner prefix, using git grep.
+
+    git grep searches in C with its own worker threads, so most files are never
+    opened from Python. Returns None when git is unavailable or directory is not
+    inside a work tree, so the caller can fall back to walking the tree.
+    """
+    pathspecs = [f':(glob)**/*{ext}' for ext in target_extensions]
+    # Mirror find_target_files: skip ignored and hidden directories at any depth
+    pathspecs += [f':(exclude,glob)**/{d}/**' for d in ignore_dirs]
+    pathspecs.append(':(exclude,glob)**/.*/**')
+    cmd = ['git', 'grep', '-z', '-l', '-F', '--untracked', '--no-exclude-standard',
+           '-e', 'EosLumina/', '--'] + pathspecs
+    try:
+        result = subprocess.run(cmd, cwd=directory, capture_output=True)
+    except OSError:
+        return None
+    # Exit status 1 just means nothing matched; anything else is an error
+    if result.returncode not in (0, 1):
+        return None
+    return [os.path.join(directory, p) for p in os.fsdecode(result.stdout).split('\0') if p]
+
 def main(directory="."):
     print(f"Scanning for potential incorrect repo references/badges in '{directory}'...")
-    count = 0
     target_extensions = ('.yml', '.yaml', '.md', '.py', '.js', '.ts', '.html', '.json') # Added more common types
     ignore_dirs = {'.git', '.vscode', 'node_modules', '__pycache__', 'venv', '.env', 'dist', 'build'} # Directories to skip
 
-    for root, dirs, files in os.walk(directory, topdown=True):
-        # Modify dirs in-place to skip ignored directories
-        dirs[:] = [d for d in dirs if d not in ignore_dirs and not d.startswith('.')]
-
-        for file in files:
-            if file.endswith(target_extensions):
-                file_path = os.path.join(root, file)
-                try:
-                    if fix_references_in_file(file_path):
-                        count += 1
-                except Exception as e:
-                    print(f"Error processing file {file_path}: {e}")
+    def process(file_path):
+        try:
+            return fix_references_in_file(file_path)
+        except Exception as e:
+            log(f"Error processing file {file_path}: {e}")
+            return False
+
+    # Let git grep narrow the candidates when we are in a work tree; files it
+    # rules out cannot contain any of the patterns
+    files = git_grep_candidates(directory, target_extensions, ignore_dirs)
+    if files is None:
+        files = find_target_files(directory, target_extensions, ignore_dirs)
+
+    # The work is dominated by blocking reads, so overlap them across threads
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        count = sum(executor.map(process, files))
 
     print(f"Scan complete. Automatically fixed badge URLs in {count} files. Found potential incorrect references (manual review needed).")
 
@@ -5,9 +5,11 @@ Converts incorrect 'EosLumina/ThinkAlike' to 'EosLumina/--ThinkAlike--'.
 """
 
 import os
-import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from colorama import init, Fore, Style
+from _fileio import atomic_write
+from _patterns import OLD_REPO_RE, NEW_REPO
 
 # Initialize colorama for colored output
 init()
@@ -25,54 +27,60 @@ def print_warning(text):
     print(f"{Fore.YELLOW}⚠ {text}{Style.RESET_ALL}")
 
 def fix_file(file_path):
-    """Fix repository references in a file."""
+    """Fix repository references in a file.
+
+    Returns a (fixed, error) pair instead of printing, so that main() can
+    report the files in order rather than as worker processes finish.
+    """
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
 
-        # Replace incorrect repository references
-        incorrect_pattern = r'EosLumina/ThinkAlike'
-        correct_pattern = r'EosLumina/--ThinkAlike--'
-
         # Save original content to check if changes are made
         original_content = content
 
-        # Replace all occurrences
-        content = re.sub(incorrect_pattern, correct_pattern, content)
+        # Replace all incorrect repository references
+        content = OLD_REPO_RE.sub(NEW_REPO, content)
 
         # Only write back if changes were made
         if original_content != content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print_success(f"Fixed references in {file_path}")
-            return 1
-        return 0
+            atomic_write(file_path, content)
+            return 1, None
+        return 0, None
     except Exception as e:
-        print_warning(f"Error processing {file_path}: {e}")
-        return 0
+        return 0, str(e)
+
+def find_files(extensions):
+    """Yield files with the given extensions in one walk, never entering .git."""
+    for root, dirs, names in os.walk('.'):
+        # Prune here rather than filtering afterwards, so .git is never listed
+        dirs[:] = [d for d in dirs if d != '.git']
+        for name in names:
+            if name.endswith(extensions):
+                yield Path(root, name)
 
 def main():
     """Fix repository references in all markdown and YAML files."""
     print_header("Fixing Repository References")
 
     # Find all markdown and YAML files
-    md_files = Path('.').rglob('*.md')
-    yml_files = Path('.').rglob('*.yml')
+    files = list(find_files(('.md', '.yml')))
 
-    # Combine file lists
-    files = list(md_files) + list(yml_files)
+    # Process all files; each one is independent, so spread them over cores
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(fix_file, files, chunksize=16))
 
-    # Skip files in .git directory
-    files = [f for f in files if '.git/' not in str(f)]
-
-    # Track statistics
+    # Report in file order, from the parent only
     fixes = 0
-    processed = 0
+    for file_path, (fixed, error) in zip(files, results):
+        if error:
+            print_warning(f"Error processing {file_path}: {error}")
+        elif fixed:
+            print_success(f"Fixed references in {file_path}")
+            fixes += 1
 
-    # Process all files
-    for file_path in files:
-        processed += 1
-        fixes += fix_file(file_path)
+    # Track statistics
+    processed = len(results)
 
     print_header("Summary")
     print(f"Processed {processed} files")
@@ -49,6 +49,24 @@ def fix_file_with_null_bytes(file_path):
             print(f"⚠️ Failed to fix binary file {file_path}: {e2}")
             return False
 
+def find_python_files(directory):
+    """Yield paths of .py files under directory, top level first.
+
+    os.scandir hands back DirEntry objects whose file type comes from the
+    directory listing itself, so no extra stat call is needed per entry.
+    """
+    subdirs = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            # Same as glob('**'): do not descend into symlinked directories
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.endswith('.py') and not entry.name.startswith('.'):
+                # Skip dot-files such as editor swap and backup copies
+                yield entry.path
+    for subdir in subdirs:
+        yield from find_python_files(subdir)
+
 def main():
     """Fix test files with null bytes."""
     test_dir = Path('tests')
@@ -57,8 +75,7 @@ def main():
         return False
 
     # Get list of Python files in the tests directory
-    test_files = test_dir.glob('**/*.py')
-    files_to_fix = [str(f) for f in test_files]
+    files_to_fix = list(find_python_files(test_dir))
 
     if not files_to_fix:
         print("No test files found!")
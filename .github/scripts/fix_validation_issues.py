@@ -4,6 +4,7 @@ Fix validation issues with GitHub workflow files by ensuring they match
 the exact format expected by the validator.
 """
 
+import filecmp
 import os
 import sys
 from pathlib import Path
@@ -60,14 +61,18 @@ jobs:
         run: echo "Hello, world!"
 """
 
-def get_reference_format():
-    """Get format from a known good workflow file or use fallback"""
+def get_reference_format(available=None):
+    """Get format from a known good workflow file or use fallback
+
+    ``available`` is an optional set of workflow filenames already listed by
+    the caller; when given it replaces a stat call per candidate file.
+    """
     workflows_dir = Path(".github/workflows")
 
     # Try to find a good reference file
     for filename in GOOD_WORKFLOW_FILES:
         file_path = workflows_dir / filename
-        if file_path.exists():
+        if (filename in available) if available is not None else file_path.exists():
             try:
                 with open(file_path, 'r') as f:
                     content = f.read()
@@ -90,9 +95,11 @@ def fix_workflow_file(file_path, reference_content, reference_name):
         with open(file_path, 'r') as f:
             content = f.read().strip()
 
-        # Save a backup
+        # Save a backup, unless an identical one is already there from an
+        # earlier run (filecmp checks size+mtime first, then the bytes)
         backup_path = f"{file_path}.bak"
-        shutil.copy2(file_path, backup_path)
+        if not (os.path.exists(backup_path) and filecmp.cmp(file_path, backup_path)):
+            shutil.copy2(file_path, backup_path)
 
         # Extract the 'on:' section from the reference file
         on_section_match = re.search(r'(^|\n)(on:[^\n]*(\n\s+[^\n]+)*)', reference_content)
@@ -156,19 +163,24 @@ def main():
         print(f"Error: .github/workflows directory not found in {os.getcwd()}")
         return 1
 
+    # List the workflow directory once; the listing is reused for every
+    # existence check below instead of stat-ing each candidate file
+    available = [workflow.name for workflow in workflows_dir.glob("*.yml")]
+
     # List all workflow files for debugging
     print("Available workflow files:")
-    for workflow in workflows_dir.glob("*.yml"):
-        print(f"- {workflow.name}")
+    for name in available:
+        print(f"- {name}")
+    available = set(available)
 
     # Get a reference format from a known good file
-    reference_content, reference_name = get_reference_format()
+    reference_content, reference_name = get_reference_format(available)
 
     # Fix each problem file
     fixed_count = 0
     for filename in PROBLEM_FILES:
         file_path = workflows_dir / filename
-        if file_path.exists():
+        if filename in available:
             if fix_workflow_file(str(file_path), reference_content, reference_name):
                 fixed_count += 1
         else:
@@ -9,6 +9,8 @@ import sys
 from pathlib import Path
 import re
 
+from _yaml import SafeLoader
+
 def validate_workflow(file_path):
     """Validate if a GitHub workflow file has correct structure"""
     try:
@@ -17,7 +19,7 @@ def validate_workflow(file_path):
 
         # Check for basic syntax errors
         try:
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=SafeLoader)
             if data is None:
                 print(f"❌ {file_path}: Empty or invalid YAML")
                 return False
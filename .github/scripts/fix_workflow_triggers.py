@@ -9,18 +9,22 @@ import sys
 from pathlib import Path
 import re
 
+from _fileio import atomic_write
+from _patterns import pick_trigger
+from _yaml import SafeLoader
+
 # YAML handling is more strict than what GitHub Actions accepts
 # This function will directly modify files without YAML parsing when needed
-def fix_workflow_file(file_path, force=False):
-    """Add missing 'on' trigger to workflow file"""
-    try:
-        # Read file content
-        with open(file_path, 'r') as f:
-            content = f.read()
+def add_on_trigger(file_path, content, force=False):
+    """Return content with an 'on' trigger added, or None if nothing changed
 
+    Works on text already in memory so that main() can run every pass over a
+    file and still read and write it only once.
+    """
+    try:
         # First try normal YAML parsing
         try:
-            yaml_content = yaml.safe_load(content)
+            yaml_content = yaml.load(content, Loader=SafeLoader)
             has_on_field = 'on' in yaml_content
         except Exception as e:
             print(f"⚠️ YAML parsing issue in {file_path}: {e}")
@@ -30,57 +34,7 @@ def fix_workflow_file(file_path, force=False):
             print(f"Adding 'on' trigger to {file_path}")
 
             # Determine appropriate triggers based on file name
-            if 'test' in file_path.lower() or 'ci' in file_path.lower():
-                on_trigger = """
-on:
-  push:
-    branches: [main]
-    paths:
-      - 'backend/**'
-      - 'tests/**'
-      - 'requirements*.txt'
-  pull_request:
-    branches: [main]
-  workflow_dispatch:
-"""
-            elif 'deploy' in file_path.lower() or 'cd' in file_path.lower() or 'gh_pages' in file_path.lower():
-                on_trigger = """
-on:
-  push:
-    branches: [main]
-    tags:
-      - 'v*.*.*'
-  workflow_dispatch:
-"""
-            elif 'doc' in file_path.lower():
-                on_trigger = """
-on:
-  push:
-    branches: [main]
-    paths:
-      - 'docs/**'
-      - '*.md'
-  pull_request:
-    branches: [main]
-  workflow_dispatch:
-"""
-            elif 'settings' in file_path.lower():
-                on_trigger = """
-on:
-  schedule:
-    - cron: "0 0 * * 0"  # Run weekly on Sundays
-  workflow_dispatch:
-"""
-            else:
-                # Default trigger
-                on_trigger = """
-on:
-  push:
-    branches: [main]
-  pull_request:
-    branches: [main]
-  workflow_dispatch:
-"""
+            on_trigger = '\n' + pick_trigger(file_path)
 
             # Insert trigger after name more robustly
             if 'name:' in content:
@@ -100,33 +54,53 @@ on:
                 # If there's no name field, just add the trigger at the beginning
                 modified_content = on_trigger + content
 
-            # Write the modified content back
-            with open(file_path, 'w') as f:
-                f.write(modified_content)
+            return modified_content
+    except Exception as e:
+        print(f"❌ Error fixing {file_path}: {e}")
+
+    return None
 
-            return True
+def fix_workflow_file(file_path, force=False):
+    """Add missing 'on' trigger to workflow file"""
+    try:
+        # Read file content
+        with open(file_path, 'r') as f:
+            content = f.read()
+
+        modified_content = add_on_trigger(file_path, content, force)
+        if modified_content is None:
+            return False
+
+        # Write the modified content back
+        atomic_write(file_path, modified_content, encoding=None)
+
+        return True
     except Exception as e:
         print(f"❌ Error fixing {file_path}: {e}")
 
     return False
 
+def has_valid_on_trigger(content):
+    """Check if workflow content has valid 'on' trigger"""
+    # Simple text-based check for 'on:' field
+    if 'on:' not in content:
+        return False
+
+    # Basic structure check using YAML
+    try:
+        yaml_content = yaml.load(content, Loader=SafeLoader)
+        return 'on' in yaml_content and yaml_content['on'] is not None
+    except:
+        # If YAML parsing fails, fall back to simple check
+        return 'on:' in content
+
 def check_workflow_validity(file_path):
     """Check if workflow file has valid 'on' trigger"""
     try:
         with open(file_path, 'r') as f:
             content = f.read()
 
-        # Simple text-based check for 'on:' field
-        if 'on:' not in content:
-            return False
-
-        # Basic structure check using YAML
-        try:
-            yaml_content = yaml.safe_load(content)
-            return 'on' in yaml_content and yaml_content['on'] is not None
-        except:
-            # If YAML parsing fails, fall back to simple check
-            return 'on:' in content
+        return has_valid_on_trigger(content)
     except Exception as e:
         print(f"Error checking {file_path}: {e}")
         return False
@@ -153,26 +127,49 @@ def main():
 
     print(f"Found {len(workflow_files)} workflow files")
 
+    # Read every file once; both passes below work on the text in memory and
+    # each changed file is written back a single time at the end
+    contents = {}
+    for workflow_file in workflow_files:
+        try:
+            with open(workflow_file, 'r') as f:
+                contents[workflow_file] = f.read()
+        except Exception as e:
+            print(f"❌ Error reading {workflow_file}: {e}")
+    changed = set()
+
     # First pass: Fix files that don't have 'on' trigger
     fixed_count = 0
-    for workflow_file in workflow_files:
-        if fix_workflow_file(str(workflow_file)):
+    for workflow_file, content in contents.items():
+        modified_content = add_on_trigger(str(workflow_file), content)
+        if modified_content is not None:
+            contents[workflow_file] = modified_content
+            changed.add(workflow_file)
             fixed_count += 1
 
     print(f"First pass: Fixed {fixed_count} workflow files")
 
     # Second pass: Force fix for any remaining issues
     problem_files = []
-    for workflow_file in workflow_files:
-        if not check_workflow_validity(str(workflow_file)):
+    for workflow_file, content in contents.items():
+        if not has_valid_on_trigger(content):
             problem_files.append(workflow_file)
 
     if problem_files:
         print(f"Found {len(problem_files)} files that still need fixing")
         for workflow_file in problem_files:
-            if fix_workflow_file(str(workflow_file), force=True):
+            modified_content = add_on_trigger(str(workflow_file), contents[workflow_file], force=True)
+            if modified_content is not None:
+                contents[workflow_file] = modified_content
+                changed.add(workflow_file)
                 fixed_count += 1
 
+    for workflow_file in changed:
+        try:
+            atomic_write(workflow_file, contents[workflow_file], encoding=None)
+        except Exception as e:
+            print(f"❌ Error fixing {workflow_file}: {e}")
+
     print(f"Total fixed: {fixed_count} workflow files")
     print("Run validation to see if all issues are resolved:")
     print("python .github/scripts/validate_workflows.py")
@@ -8,338 +8,35 @@ import os
 from pathlib import Path
 import yaml
 
-# Map of problematic files and their complete correct content
-WORKFLOW_FIXES = {
-    "fixed_consolidated-ci.yml": """name: Consolidated CI (Fixed)
-
-on:
-  push:
-    branches: [main]
-  pull_request:
-    branches: [main]
-  workflow_dispatch:
-
-jobs:
-  test:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Set up Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install pytest
-          if [ -f requirements.txt ]; then pip install -r requirements.txt; fi
-      - name: Test with pytest
-        run: pytest
-""",
-
-    "fixed_run-tests.yml": """name: Run Tests (Fixed)
-
-on:
-  push:
-    branches: [main]
-    paths:
-      - 'backend/**'
-      - 'tests/**'
-      - 'requirements*.txt'
-  pull_request:
-    branches: [main]
-  workflow_dispatch:
-
-jobs:
-  test:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Set up Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install pytest
-          if [ -f requirements.txt]; then pip install -r requirements.txt; fi
-      - name: Test with pytest
-        run: pytest
-""",
-
-    "fixed_documentation.yml": """name: Documentation (Fixed)
-
-on:
-  push:
-    branches: [main]
-    paths:
-      - 'docs/**'
-      - '*.md'
-  pull_request:
-    branches: [main]
-  workflow_dispatch:
-
-jobs:
-  build:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Set up Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install mkdocs
-      - name: Build docs
-        run: mkdocs build
-""",
-
-    "deploy_to_gh_pages.yml": """name: Deploy to GitHub Pages
-
-on:
-  push:
-    branches: [main]
-    paths:
-      - 'docs/**'
-      - '*.md'
-  workflow_dispatch:
-
-jobs:
-  deploy:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Setup Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install mkdocs mkdocs-material
-      - name: Build site
-        run: mkdocs build
-      - name: Deploy
-        uses: peaceiris/actions-gh-pages@v3
-        with:
-          github_token: ${{ secrets.GITHUB_TOKEN }}
-          publish_dir: ./site
-""",
-
-    "fixed_settings.yml": """name: Repository Settings (Fixed)
-
-on:
-  schedule:
-    - cron: "0 0 * * 0"  # Run weekly on Sundays
-  workflow_dispatch:
-
-jobs:
-  settings:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Apply repository settings
-        uses: probot/settings@v1
-        with:
-          settings_file: .github/config/repository-settings.yml
-        env:
-          GITHUB_TOKEN: ${{ secrets.GITHUB_TOKEN }}
-""",
-
-    "fixed_deploy_to_gh_pages.yml": """name: Deploy to GitHub Pages (Fixed)
-
-on:
-  push:
-    branches: [main]
-    paths:
-      - 'docs/**'
-      - '*.md'
-  workflow_dispatch:
-
-jobs:
-  deploy:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Setup Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install mkdocs mkdocs-material
-      - name: Build site
-        run: mkdocs build
-      - name: Deploy
-        uses: peaceiris/actions-gh-pages@v3
-        with:
-          github_token: ${{ secrets.GITHUB_TOKEN }}
-          publish_dir: ./site
-""",
-
-    "unified-workflow.yml": """name: Unified Workflow
-
-on:
-  push:
-    branches: [main]
-  pull_request:
-    branches: [main]
-  workflow_dispatch:
-
-jobs:
-  test:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Set up Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install pytest
-          if [ -f requirements.txt ]; then pip install -r requirements.txt; fi
-      - name: Test with pytest
-        run: pytest
-""",
-
-    "run-tests.yml": """name: Run Tests
-
-on:
-  push:
-    branches: [main]
-    paths:
-      - 'backend/**'
-      - 'tests/**'
-      - 'requirements*.txt'
-  pull_request:
-    branches: [main]
-  workflow_dispatch:
-
-jobs:
-  test:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Set up Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install pytest
-          if [ -f requirements.txt ]; then pip install -r requirements.txt; fi
-      - name: Test with pytest
-        run: pytest
-""",
-
-    "deploy.yml": """name: Deploy
-
-on:
-  push:
-    branches: [main]
-    tags:
-      - 'v*.*.*'
-  workflow_dispatch:
-
-jobs:
-  deploy:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Set up Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          if [ -f requirements.txt ]; then pip install -r requirements.txt; fi
-      - name: Deploy
-        run: echo "Deploying application..."
-""",
-
-    "documentation.yml": """name: Documentation
-
-on:
-  push:
-    branches: [main]
-    paths:
-      - 'docs/**'
-      - '*.md'
-  pull_request:
-    branches: [main]
-  workflow_dispatch:
-
-jobs:
-  build:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Set up Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install mkdocs
-      - name: Build docs
-        run: mkdocs build
-""",
-
-    "settings.yml": """name: Repository Settings
-
-on:
-  schedule:
-    - cron: "0 0 * * 0"  # Run weekly on Sundays
-  workflow_dispatch:
-
-jobs:
-  settings:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Apply repository settings
-        uses: probot/settings@v1
-        with:
-          settings_file: .github/config/repository-settings.yml
-        env:
-          GITHUB_TOKEN: ${{ secrets.GITHUB_TOKEN }}
-""",
-
-    "fixed_deploy.yml": """name: Fixed Deploy
-
-on:
-  push:
-    branches: [main]
-    tags:
-      - 'v*.*.*'
-  workflow_dispatch:
-
-jobs:
-  deploy:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Set up Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          if [ -f requirements.txt ]; then pip install -r requirements.txt; fi
-      - name: Deploy
-        run: echo "Deploying application..."
-"""
-}
+from _yaml import SafeLoader
+
+# Known-good workflow bodies live in .github/workflow_templates/known_good/;
+# resolved now because main() may chdir to the repo root
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "workflow_templates" / "known_good"
+
+# Problematic files, each replaced by the template of the same name
+WORKFLOW_FIXES = (
+    "fixed_consolidated-ci.yml",
+    "fixed_run-tests.yml",
+    "fixed_documentation.yml",
+    "deploy_to_gh_pages.yml",
+    "fixed_settings.yml",
+    "fixed_deploy_to_gh_pages.yml",
+    "unified-workflow.yml",
+    "run-tests.yml",
+    "deploy.yml",
+    "documentation.yml",
+    "settings.yml",
+    "fixed_deploy.yml",
+)
+
+def load_workflow_template(filename):
+    """Read the known-good content for a workflow file from the templates directory
+
+    Returned as bytes: the content is only ever written back out verbatim,
+    so there is no need to decode it and encode it again.
+    """
+    return (TEMPLATES_DIR / filename).read_bytes()
 
 def is_valid_workflow(file_path):
     """Check if a workflow file has a valid structure"""
@@ -349,7 +46,7 @@ def is_valid_workflow(file_path):
 
         # Try to parse as YAML
         try:
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=SafeLoader)
             if not data or not isinstance(data, dict):
                 return False
             # Check if 'on' is present and properly formed
@@ -375,8 +72,7 @@ def force_fix_workflow(file_path, correct_content):
             return False
 
         # If not valid, completely overwrite
-        with open(file_path, 'w') as f:
-            f.write(correct_content)
+        Path(file_path).write_bytes(correct_content)
 
         print(f"✅ Fixed {file_path} by complete replacement")
         return True
@@ -400,10 +96,10 @@ def main():
     fixed_count = 0
 
     # Process each problematic file
-    for filename, correct_content in WORKFLOW_FIXES.items():
+    for filename in WORKFLOW_FIXES:
         file_path = workflows_dir / filename
         if file_path.exists():
-            if force_fix_workflow(str(file_path), correct_content):
+            if force_fix_workflow(str(file_path), load_workflow_template(filename)):
                 fixed_count += 1
         else:
             print(f"⚠️ File {filename} not found")
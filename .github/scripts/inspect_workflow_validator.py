@@ -125,6 +125,17 @@ def compare_files(valid_file, invalid_file):
         print(f"   Valid: {valid_on_whitespace}")
         print(f"   Invalid: {invalid_on_whitespace}")
 
+def find_available_files(workflows_dir, filenames, kind):
+    """Return the paths of the named workflow files that exist, warning about the rest"""
+    available = []
+    for filename in filenames:
+        file_path = workflows_dir / filename
+        if file_path.exists():
+            available.append(file_path)
+        else:
+            print(f"Warning: {kind} file {filename} not found, skipping")
+    return available
+
 def main():
     """Inspect workflow files to understand validation issues"""
     # Ensure we're in repository root
@@ -138,21 +149,8 @@ def main():
         return 1
 
     # Check if the specified files exist
-    available_valid_files = []
-    for filename in VALID_WORKFLOWS:
-        file_path = workflows_dir / filename
-        if file_path.exists():
-            available_valid_files.append(file_path)
-        else:
-            print(f"Warning: Valid file {filename} not found, skipping")
-
-    available_invalid_files = []
-    for filename in INVALID_WORKFLOWS:
-        file_path = workflows_dir / filename
-        if file_path.exists():
-            available_invalid_files.append(file_path)
-        else:
-            print(f"Warning: Invalid file {filename} not found, skipping")
+    available_valid_files = find_available_files(workflows_dir, VALID_WORKFLOWS, "Valid")
+    available_invalid_files = find_available_files(workflows_dir, INVALID_WORKFLOWS, "Invalid")
 
     if not available_valid_files or not available_invalid_files:
         print("Error: Not enough files to compare")
@@ -3,19 +3,73 @@
 Set up test environment by installing required dependencies
 """
 
+import importlib.metadata
+import importlib.util
 import os
 import subprocess
 import sys
 
-def run_command(command):
-    """Run a shell command and print output."""
-    print(f"Running: {command}")
-    process = subprocess.run(command, shell=True, text=True)
+try:
+    from packaging.requirements import InvalidRequirement, Requirement
+except ImportError:
+    # Without packaging we cannot check versions; always defer to pip
+    Requirement = None
+
+# Skip pip's self-version check and never stop to prompt; prefer wheels over
+# building sdists when both are available
+PIP_ENV = {**os.environ, 'PIP_DISABLE_PIP_VERSION_CHECK': '1', 'PIP_NO_INPUT': '1'}
+PIP_INSTALL = [sys.executable, '-m', 'pip', 'install', '--prefer-binary']
+
+def run_command(command, env=None):
+    """Run a command given as an argument list and print output.
+
+    No shell is involved, so there is no extra /bin/sh process per command and
+    paths with spaces need no quoting.
+    """
+    print(f"Running: {' '.join(command)}")
+    process = subprocess.run(command, text=True, env=env)
     if process.returncode != 0:
         print(f"Command failed with exit code {process.returncode}")
         return False
     return True
 
+def unsatisfied_requirements(path):
+    """Return the requirements in path that are not installed at a matching version.
+
+    Returns None when the file cannot be checked here (packaging missing, pip
+    options, URLs or anything else that is not a plain requirement), in which
+    case the caller should hand the whole file to pip.
+    """
+    if Requirement is None:
+        return None
+
+    needed = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.split(' #', 1)[0].strip()
+            if not line or line.startswith('#'):
+                continue
+            if line.startswith('-'):
+                return None
+            try:
+                req = Requirement(line)
+            except InvalidRequirement:
+                return None
+            if req.url:
+                return None
+            if req.marker and not req.marker.evaluate():
+                continue
+            try:
+                version = importlib.metadata.version(req.name)
+            except importlib.metadata.PackageNotFoundError:
+                needed.append(str(req))
+                continue
+            if req.extras or not req.specifier.contains(version, prereleases=True):
+                # Extras pull in further packages we do not track, so let pip
+                # decide whether anything is missing
+                needed.append(str(req))
+    return needed
+
 def setup_test_environment():
     """Install test dependencies and ensure environment is ready for testing."""
     # Check if requirements-test.txt exists
@@ -29,18 +83,28 @@ httpx>=0.24.0  # Required by starlette.testclient
 pandas>=2.0.0  # Required by tests/test_ethical_compliance.py
 """)
 
-    # Install regular requirements first
+    # Project and test requirements go to a single pip run: one interpreter
+    # startup and one resolver pass over both sets. pip runs are not started
+    # side by side instead, because concurrent installs into the same
+    # environment can overwrite each other's files.
+    install_args = []
     if os.path.exists('requirements.txt'):
-        print("📦 Installing project dependencies...")
-        if not run_command('pip install -r requirements.txt'):
-            print("⚠️ Failed to install project dependencies")
-            return False
+        install_args += ['-r', 'requirements.txt']
 
-    # Install test dependencies
-    print("📦 Installing test dependencies...")
-    if not run_command('pip install -r requirements-test.txt'):
-        print("⚠️ Failed to install test dependencies")
-        return False
+    # Test requirements that are already installed need no pip work at all
+    needed = unsatisfied_requirements('requirements-test.txt')
+    if needed is None:
+        install_args += ['-r', 'requirements-test.txt']
+    else:
+        install_args += needed
+
+    if install_args:
+        print("📦 Installing project and test dependencies...")
+        if not run_command(PIP_INSTALL + install_args, env=PIP_ENV):
+            print("⚠️ Failed to install dependencies")
+            return False
+    else:
+        print("📦 Test dependencies already installed")
 
     # Fix any files with null bytes
     print("🔍 Checking for files with null bytes...")
@@ -50,8 +114,15 @@ pandas>=2.0.0  # Required by tests/test_ethical_compliance.py
         print("⚠️ fix_null_bytes.py script not found.")
         return False
 
-    if not run_command(f'python {fix_script_path}'):
-        print("⚠️ Failed to fix files with null bytes")
+    # Run the fixer in this interpreter rather than paying for a second
+    # Python startup just to scan the tests directory
+    try:
+        spec = importlib.util.spec_from_file_location('fix_null_bytes', fix_script_path)
+        fix_null_bytes = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(fix_null_bytes)
+        fix_null_bytes.main([])
+    except Exception as e:
+        print(f"⚠️ Failed to fix files with null bytes: {e}")
         return False
 
     print("✅ Test environment setup complete!")
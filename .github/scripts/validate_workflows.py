@@ -3,9 +3,21 @@ import os
 import sys
 import yaml
 
+from _fileio import load_stat_cache, save_stat_cache, stat_key
+from _yaml import SafeLoader
+
+# Workflows that passed validation, keyed by path with their mtime and size,
+# so that reruns skip parsing files that have not changed since. Kept at the
+# root of the repository that owns the workflow directory.
+CACHE_FILE = '.workflow_cache.json'
+
 def validate_workflows():
     workflow_dir = '.github/workflows'
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(workflow_dir)))
+    cache_file = os.path.join(repo_root, CACHE_FILE)
     all_valid = True
+    cache = load_stat_cache(cache_file)
+    passed = {}
     
     for filename in os.listdir(workflow_dir):
         if not (filename.endswith('.yml') or filename.endswith('.yaml')):
@@ -17,9 +29,15 @@ def validate_workflows():
         file_path = os.path.join(workflow_dir, filename)
         
         try:
+            key = stat_key(os.stat(file_path))
+            if cache.get(file_path) == key:
+                passed[file_path] = key
+                print(f"✅ {file_path} is valid YAML")
+                continue
+
             with open(file_path, 'r') as f:
                 content = f.read()
-                yaml_content = yaml.safe_load(content)
+                yaml_content = yaml.load(content, Loader=SafeLoader)
                 
             # Basic structure validation
             if not isinstance(yaml_content, dict):
@@ -28,13 +46,17 @@ def validate_workflows():
                 continue
                 
             required_keys = ['name', 'on', 'jobs']
-            for key in required_keys:
-                if key not in yaml_content:
-                    print(f"❌ Error in {file_path}: Missing required key: '{key}'")
+            missing = False
+            for required_key in required_keys:
+                if required_key not in yaml_content:
+                    print(f"❌ Error in {file_path}: Missing required key: '{required_key}'")
                     all_valid = False
+                    missing = True
                     continue
                     
             print(f"✅ {file_path} is valid YAML")
+            if not missing:
+                passed[file_path] = key
             
         except yaml.YAMLError as e:
             print(f"❌ Error in {file_path}: YAML parsing failed: {str(e)}")
@@ -43,6 +65,8 @@ def validate_workflows():
             print(f"❌ Error in {file_path}: {str(e)}")
             all_valid = False
     
+    save_stat_cache(cache_file, passed)
+
     if all_valid:
         print("\n✅ All workflow files are valid! ✓")
         return 0
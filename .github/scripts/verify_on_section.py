@@ -9,6 +9,9 @@ import sys
 import re
 from pathlib import Path
 
+# Compiled once rather than looked up in re's cache for every file
+ON_SECTION_RE = re.compile(r'(?:^|\n)\s*on\s*:')
+
 def verify_on_section(file_path):
     """Verify if a workflow file has a properly formatted 'on' section"""
     try:
@@ -16,7 +19,7 @@ def verify_on_section(file_path):
             content = f.read()
 
         # Check for 'on:' with regex
-        on_match = re.search(r'(?:^|\n)\s*on\s*:', content)
+        on_match = ON_SECTION_RE.search(content)
         if not on_match:
             print(f"❌ {file_path}: Missing 'on:' section")
             return False
@@ -9,9 +9,17 @@ and contain all required sections.
 import os
 import sys
 import re
-import yaml
 from typing import Dict, List, Tuple, Optional, Any, Set
 
+# Patterns used for every workflow, compiled once at import
+# Spaces just inside either bracket; substituting r'\1\2' keeps whichever
+# bracket matched (the other group is empty), so both sides are fixed in one pass
+BRACKET_SPACE_RE = re.compile(r'(\[) +| +(\])')
+JOBS_RE = re.compile(r'^\s*jobs\s*:', re.MULTILINE)
+JOBS_CONTENT_RE = re.compile(r'^\s*jobs\s*:\s*\n(\s+\S+)', re.MULTILINE)
+ON_RE = re.compile(r'^\s*on\s*:', re.MULTILINE)
+QUOTED_ON_RE = re.compile(r"^\s*'on'\s*:", re.MULTILINE)
+
 
 class WorkflowValidator:
     """Validator for GitHub Actions workflow files."""
@@ -74,35 +82,37 @@ class WorkflowValidator:
                     file_path, f"Unexpected error during validation: {e}")
                 all_valid = False
 
-        # Print summary
+        # Print summary, collected into one buffer and written once
         if self.verbose:
-            print("\n=== Validation Summary ===")
-            print(f"Files processed: {len(file_paths)}")
-            print(f"Errors found: {len([e for e in self.errors if not e[2]])}")
-            print(
+            lines = ["\n=== Validation Summary ==="]
+            lines.append(f"Files processed: {len(file_paths)}")
+            lines.append(f"Errors found: {len([e for e in self.errors if not e[2]])}")
+            lines.append(
                 f"Warnings found: {len([w for w in self.warnings if not w[2]])}")
             if fix:
-                print(f"Fixes applied: {len(self.fixes)}")
-                print(f"Errors fixed: {len([e for e in self.errors if e[2]])}")
-                print(
+                lines.append(f"Fixes applied: {len(self.fixes)}")
+                lines.append(f"Errors fixed: {len([e for e in self.errors if e[2]])}")
+                lines.append(
                     f"Warnings fixed: {len([w for w in self.warnings if w[2]])}")
 
             if self.errors:
-                print("\n=== Errors ===")
+                lines.append("\n=== Errors ===")
                 for file_path, message, fixed in self.errors:
                     status = "[FIXED]" if fixed else ""
-                    print(f"{file_path}: {message} {status}")
+                    lines.append(f"{file_path}: {message} {status}")
 
             if self.warnings:
-                print("\n=== Warnings ===")
+                lines.append("\n=== Warnings ===")
                 for file_path, message, fixed in self.warnings:
                     status = "[FIXED]" if fixed else ""
-                    print(f"{file_path}: {message} {status}")
+                    lines.append(f"{file_path}: {message} {status}")
 
             if fix and self.fixes:
-                print("\n=== Fixes Applied ===")
+                lines.append("\n=== Fixes Applied ===")
                 for file_path, message in self.fixes:
-                    print(f"{file_path}: {message}")
+                    lines.append(f"{file_path}: {message}")
+
+            sys.stdout.write("\n".join(lines) + "\n")
 
         return all_valid
 
@@ -117,6 +127,9 @@ class WorkflowValidator:
         Returns:
             bool: True if file is valid (or fixed), False otherwise
         """
+        # Imported here so that --help and argument errors never pay for yaml
+        import yaml
+
         self.log(f"Validating {file_path}...")
 
         # Read the original content
@@ -135,12 +148,13 @@ class WorkflowValidator:
                 content = f"---\n{content}"
                 self.add_fix(file_path, "Added document start marker '---'")
 
-        # Check 2: Fix bracket spacing
-        if re.search(r'\[ +', content) or re.search(r' +\]', content):
+        # Check 2: Fix bracket spacing. '[ ' / ' ]' match exactly when the
+        # regex below would, but a substring test avoids the regex engine
+        # for the common case of files with no such spacing
+        if '[ ' in content or ' ]' in content:
             self.add_warning(file_path, "Inconsistent spacing inside brackets")
             if fix:
-                content = re.sub(r'\[ +', '[', content)
-                content = re.sub(r' +\]', ']', content)
+                content = BRACKET_SPACE_RE.sub(r'\1\2', content)
                 self.add_fix(file_path, "Fixed spacing inside brackets")
 
         # Try to parse YAML to validate structure
@@ -151,18 +165,19 @@ class WorkflowValidator:
                     file_path, "File appears to be empty or invalid YAML")
                 is_valid = False
             else:
-                # Directly check for jobs in content
-                jobs_match = re.search(r'^\s*jobs\s*:', content, re.MULTILINE)
+                # Directly check for jobs in content; the match is shared with
+                # the structure and jobs checks so the file is scanned once
+                jobs_match = JOBS_RE.search(content)
                 if not jobs_match:
                     self.add_error(file_path, "Jobs section is missing")
                     is_valid = False
 
                 # Check for basic structure
-                if not self._validate_workflow_structure(file_path, yaml_content, content):
+                if not self._validate_workflow_structure(file_path, yaml_content, content, jobs_match):
                     is_valid = False
 
                 # Check jobs section
-                if not self._validate_jobs_section(file_path, yaml_content, content):
+                if not self._validate_jobs_section(file_path, yaml_content, content, jobs_match):
                     is_valid = False
 
                 # If YAML parsing succeeded but jobs don't appear in the parsed YAML
@@ -182,7 +197,8 @@ class WorkflowValidator:
 
         return is_valid
 
-    def _validate_workflow_structure(self, file_path: str, yaml_content: Dict, raw_content: str) -> bool:
+    def _validate_workflow_structure(self, file_path: str, yaml_content: Dict, raw_content: str,
+                                     jobs_match: Optional[re.Match]) -> bool:
         """
         Validate the basic structure of a workflow file including 'on' section.
 
@@ -190,6 +206,7 @@ class WorkflowValidator:
             file_path: Path to the workflow file
             yaml_content: Parsed YAML content
             raw_content: Raw file content as string
+            jobs_match: Match for the 'jobs:' line in raw_content, if any
 
         Returns:
             bool: True if structure is valid, False otherwise
@@ -202,7 +219,7 @@ class WorkflowValidator:
 
         # Check for 'on' section by regex first (most reliable)
         on_section_found = False
-        on_match = re.search(r'^\s*on\s*:', raw_content, re.MULTILINE)
+        on_match = ON_RE.search(raw_content)
         if on_match:
             self.log(
                 f"Found 'on:' section directly in file content at position {on_match.start()}")
@@ -210,7 +227,7 @@ class WorkflowValidator:
 
         # If not found, check for 'on': (with quotes)
         if not on_section_found:
-            on_match = re.search(r"^\s*'on'\s*:", raw_content, re.MULTILINE)
+            on_match = QUOTED_ON_RE.search(raw_content)
             if on_match:
                 self.log(
                     f"Found 'on:' section (with quotes) in file content at position {on_match.start()}")
@@ -230,24 +247,22 @@ class WorkflowValidator:
                 f"Warning: Found 'on:' in content but not in parsed YAML. Possible YAML parsing issue.")
 
         # Check for jobs section
-        jobs_match = re.search(r'^\s*jobs\s*:', raw_content, re.MULTILINE)
         if not jobs_match:
             self.add_error(file_path, "Workflow missing 'jobs' section")
             is_valid = False
 
         return is_valid
 
-    def _validate_jobs_section(self, file_path: str, yaml_content: Dict, raw_content: str) -> bool:
+    def _validate_jobs_section(self, file_path: str, yaml_content: Dict, raw_content: str,
+                               jobs_match: Optional[re.Match]) -> bool:
         """Validate the 'jobs' section of a workflow file."""
         # Check for jobs section in raw content first
-        jobs_match = re.search(r'^\s*jobs\s*:', raw_content, re.MULTILINE)
         if not jobs_match:
             return False  # Already reported in _validate_workflow_structure
 
         # Check if there's actual content in the jobs section
         # Look for indented content after "jobs:"
-        jobs_content_match = re.search(
-            r'^\s*jobs\s*:\s*\n(\s+\S+)', raw_content, re.MULTILINE)
+        jobs_content_match = JOBS_CONTENT_RE.search(raw_content)
         if not jobs_content_match:
             self.add_error(file_path, "Jobs section appears to be empty")
             return False